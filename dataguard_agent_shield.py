@@ -6,13 +6,17 @@ A comprehensive PII protection solution for AI agents with no external dependenc
 
 import os
 import json
+import asyncio
 import time
 import uuid
 import functools
+import inspect
 import re
+from bisect import bisect_right
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Callable, Mapping, Pattern, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
@@ -20,6 +24,53 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# PII detection patterns, compiled once at import and shared by every shield
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+CREDIT_CARD_PATTERN = re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b')
+SSN_PATTERN = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
+ACCOUNT_NUMBER_PATTERN = re.compile(r'\b\d{8,12}\b')
+API_KEY_PATTERN = re.compile(r'sk-[a-zA-Z0-9]{32,}')
+# NUL is excluded so a match can never run across two leaves of a batched scan
+DATABASE_URL_PATTERN = re.compile(r'[a-zA-Z]+://[^/\\s\x00]+:[^/\\s\x00]+@[^/\\s\x00]+')
+
+# Session start times are diagnostic, so calls within the same millisecond
+# share one formatted timestamp instead of each formatting their own
+_last_iso_ns = -1_000_000
+_last_iso = ""
+
+def _iso_now(now_ns: int) -> str:
+    """Return the current time in ISO format, reused for up to 1 ms."""
+    global _last_iso_ns, _last_iso
+    if now_ns - _last_iso_ns >= 1_000_000:
+        _last_iso = datetime.now().isoformat()
+        _last_iso_ns = now_ns
+    return _last_iso
+
+# Most coroutine agent calls protect_batch runs at once, by default
+BATCH_MAX_CONCURRENCY = 10
+
+# How _protect_input treats each node type. Exact types are looked up
+# directly; subclasses are classified once with isinstance and remembered.
+_NODE_KINDS = {str: "str", dict: "dict", list: "list", tuple: "tuple"}
+
+def _node_kind(node_type: type) -> str:
+    """Classify a node type for the payload walk."""
+    kind = _NODE_KINDS.get(node_type)
+    if kind is None:
+        if issubclass(node_type, str):
+            kind = "str"
+        elif issubclass(node_type, dict):
+            kind = "dict"
+        elif issubclass(node_type, tuple):
+            kind = "tuple"
+        elif issubclass(node_type, list):
+            kind = "list"
+        else:
+            kind = "leaf"
+        _NODE_KINDS[node_type] = kind
+    return kind
+
 class AgentType(Enum):
     """Types of AI agents that can be protected."""
     CUSTOMER_SERVICE = "customer_service"
@@ -40,7 +91,7 @@ class ProtectionLevel(Enum):
     COMPREHENSIVE = "comprehensive"
     ENTERPRISE = "enterprise"
 
-@dataclass
+@dataclass(slots=True)
 class ProtectionResult:
     """Result of agent protection operation."""
     original_input: Any
@@ -52,6 +103,111 @@ class ProtectionResult:
     agent_id: str
     session_id: str
 
+@dataclass(slots=True)
+class SessionRecord:
+    """Per-call record of a protected agent session."""
+    session_id: str
+    agent_id: str
+    agent_type: str
+    protection_level: str
+    start_time: str
+    detected_entities: List[Dict[str, Any]] = field(default_factory=list)
+
+@functools.lru_cache(maxsize=None)
+def _build_agent_configs() -> Mapping[AgentType, Mapping[str, Any]]:
+    """
+    Build the read-only agent configuration table.
+
+    The table depends only on the AgentType enum, so it is built once and
+    shared by every shield instead of being rebuilt in each __init__.
+    """
+    configs = {}
+    
+    for agent_type in AgentType:
+        if agent_type == AgentType.CUSTOMER_SERVICE:
+            configs[agent_type] = MappingProxyType({
+                "protect_customer_data": True,
+                "protect_payment_info": True,
+                "protect_addresses": True,
+                "protect_phone_numbers": True,
+                "protect_email_addresses": True,
+                "protect_order_numbers": True,
+                "protect_account_numbers": True
+            })
+        elif agent_type == AgentType.DATA_ANALYSIS:
+            configs[agent_type] = MappingProxyType({
+                "protect_database_credentials": True,
+                "protect_api_keys": True,
+                "protect_business_data": True,
+                "protect_financial_data": True,
+                "protect_personal_identifiers": True,
+                "protect_sensitive_metrics": True
+            })
+        elif agent_type == AgentType.AUTOMATION:
+            configs[agent_type] = MappingProxyType({
+                "protect_system_credentials": True,
+                "protect_automation_paths": False,  # Allow automation paths
+                "protect_api_endpoints": True,
+                "protect_configuration_data": True,
+                "protect_log_data": True
+            })
+        elif agent_type == AgentType.FINANCIAL:
+            configs[agent_type] = MappingProxyType({
+                "protect_account_numbers": True,
+                "protect_transaction_data": True,
+                "protect_balance_info": True,
+                "protect_routing_numbers": True,
+                "protect_credit_card_data": True,
+                "protect_tax_identifiers": True
+            })
+        elif agent_type == AgentType.HEALTHCARE:
+            configs[agent_type] = MappingProxyType({
+                "protect_medical_records": True,
+                "protect_patient_identifiers": True,
+                "protect_diagnosis_data": True,
+                "protect_treatment_plans": True,
+                "protect_insurance_info": True,
+                "protect_pharmacy_data": True
+            })
+        else:
+            configs[agent_type] = MappingProxyType({
+                "protect_personal_data": True,
+                "protect_credentials": True,
+                "protect_financial_data": True,
+                "protect_addresses": True
+            })
+    
+    return MappingProxyType(configs)
+
+@functools.lru_cache(maxsize=None)
+def _build_detection_pattern(agent_type: AgentType) -> Pattern[str]:
+    """
+    Combine the detection patterns enabled for an agent type into one regex.
+    
+    Each entity type becomes a named group, in detection order, so a single
+    finditer pass finds every entity and ``match.lastgroup`` names its type.
+    The agent's protect_* flags are resolved here once, not for every
+    scanned string.
+    """
+    agent_config = _build_agent_configs().get(agent_type, {})
+    rules = []
+    
+    if agent_config.get("protect_email_addresses", True):
+        rules.append(("email", EMAIL_PATTERN))
+    if agent_config.get("protect_phone_numbers", True):
+        rules.append(("phone", PHONE_PATTERN))
+    if agent_config.get("protect_credit_card_data", True) or agent_config.get("protect_payment_info", True):
+        rules.append(("credit_card", CREDIT_CARD_PATTERN))
+    rules.append(("ssn", SSN_PATTERN))
+    if agent_config.get("protect_account_numbers", True):
+        rules.append(("account_number", ACCOUNT_NUMBER_PATTERN))
+    if agent_config.get("protect_api_keys", True):
+        rules.append(("api_key", API_KEY_PATTERN))
+    if agent_config.get("protect_database_credentials", True):
+        rules.append(("database_url", DATABASE_URL_PATTERN))
+    
+    return re.compile("|".join(f"(?P<{entity_type}>{pattern.pattern})" for entity_type, pattern in rules))
+
 class DataGuardAgentShield:
     """
     DataGuard Agent Shield - Standalone PII protection for AI agents.
@@ -76,157 +232,390 @@ class DataGuardAgentShield:
         self.persistence_enabled = persistence_enabled
         self.debug_mode = debug_mode
         
+        # Enum values read on every protected call, resolved once here
+        self._agent_type_str = agent_type.value
+        self._protection_level_str = protection_level.value
+        
         # Entity persistence storage
         self.entity_mappings = {}
-        self.agent_sessions = {}
+        self.agent_sessions: Dict[str, SessionRecord] = {}
+        
+        # Analytics snapshots by (agent_id, session_id) filter, cleared
+        # whenever a session is opened, closed or records entities
+        self._analytics_cache: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
         
         # Agent-specific configurations
         self.agent_configs = self._initialize_agent_configs()
+        self._detection_pattern = _build_detection_pattern(agent_type)
         
         logger.info(f"DataGuard Agent Shield initialized for {agent_type.value} agent with {protection_level.value} protection")
     
-    def _initialize_agent_configs(self) -> Dict[AgentType, Dict[str, Any]]:
+    def _initialize_agent_configs(self) -> Mapping[AgentType, Mapping[str, Any]]:
         """Initialize agent-specific configurations."""
-        configs = {}
-        
-        for agent_type in AgentType:
-            if agent_type == AgentType.CUSTOMER_SERVICE:
-                configs[agent_type] = {
-                    "protect_customer_data": True,
-                    "protect_payment_info": True,
-                    "protect_addresses": True,
-                    "protect_phone_numbers": True,
-                    "protect_email_addresses": True,
-                    "protect_order_numbers": True,
-                    "protect_account_numbers": True
-                }
-            elif agent_type == AgentType.DATA_ANALYSIS:
-                configs[agent_type] = {
-                    "protect_database_credentials": True,
-                    "protect_api_keys": True,
-                    "protect_business_data": True,
-                    "protect_financial_data": True,
-                    "protect_personal_identifiers": True,
-                    "protect_sensitive_metrics": True
-                }
-            elif agent_type == AgentType.AUTOMATION:
-                configs[agent_type] = {
-                    "protect_system_credentials": True,
-                    "protect_automation_paths": False,  # Allow automation paths
-                    "protect_api_endpoints": True,
-                    "protect_configuration_data": True,
-                    "protect_log_data": True
-                }
-            elif agent_type == AgentType.FINANCIAL:
-                configs[agent_type] = {
-                    "protect_account_numbers": True,
-                    "protect_transaction_data": True,
-                    "protect_balance_info": True,
-                    "protect_routing_numbers": True,
-                    "protect_credit_card_data": True,
-                    "protect_tax_identifiers": True
-                }
-            elif agent_type == AgentType.HEALTHCARE:
-                configs[agent_type] = {
-                    "protect_medical_records": True,
-                    "protect_patient_identifiers": True,
-                    "protect_diagnosis_data": True,
-                    "protect_treatment_plans": True,
-                    "protect_insurance_info": True,
-                    "protect_pharmacy_data": True
-                }
-            else:
-                configs[agent_type] = {
-                    "protect_personal_data": True,
-                    "protect_credentials": True,
-                    "protect_financial_data": True,
-                    "protect_addresses": True
-                }
-        
-        return configs
+        return _build_agent_configs()
 
     def protect_agent(self, func: Callable) -> Callable:
         """
         Decorator to protect an AI agent function.
         
+        Coroutine functions get an async wrapper, so protected agents can
+        be fanned out with asyncio.gather.
+        
         Args:
             func: The function to protect
             
         Returns:
             Protected function wrapper
         """
-        @functools.wraps(func)
-        def protected_wrapper(*args, **kwargs):
-            start_time = time.time()
-            agent_id = str(uuid.uuid4())
-            session_id = str(uuid.uuid4())
-            
-            # Store session info
-            self.agent_sessions[session_id] = {
-                "agent_id": agent_id,
-                "agent_type": self.agent_type.value,
-                "protection_level": self.protection_level.value,
-                "start_time": datetime.now().isoformat(),
-                "detected_entities": []
-            }
-            
-            try:
-                # Protect input data
-                protected_args = self._protect_input(args, session_id)
-                protected_kwargs = self._protect_input(kwargs, session_id)
-                
-                # Execute the original function
-                original_output = func(*protected_args, **protected_kwargs)
-                
-                # Protect output data
-                protected_output = self._protect_output(original_output, session_id)
-                
-                # Calculate processing time
-                processing_time_ms = (time.time() - start_time) * 1000
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def protected_wrapper(*args, **kwargs):
+                # Nothing reads session data when it is neither persisted nor
+                # logged, so skip the IDs, timestamps and session bookkeeping
+                if not self.persistence_enabled and not self.debug_mode:
+                    try:
+                        scanned = {}
+                        protected_args, protected_kwargs = self._protect_arguments(args, kwargs, None, scanned)
+                        return self._protect_output(await func(*protected_args, **protected_kwargs), None, scanned)
+                    except Exception as e:
+                        logger.error(f"Error in protected agent {func.__name__}: {str(e)}")
+                        raise
                 
-                # Create protection result
-                result = ProtectionResult(
-                    original_input={"args": args, "kwargs": kwargs},
-                    protected_input={"args": protected_args, "kwargs": protected_kwargs},
-                    original_output=original_output,
-                    protected_output=protected_output,
-                    detected_entities=self._get_detected_entities(session_id),
-                    processing_time_ms=processing_time_ms,
-                    agent_id=agent_id,
-                    session_id=session_id
-                )
+                agent_id, session_id, start_ns = self._open_session()
                 
-                # Log protection result
-                self._log_protection_result(result)
+                try:
+                    # Protect input data
+                    scanned = {}
+                    protected_args, protected_kwargs = self._protect_arguments(args, kwargs, session_id, scanned)
+                    
+                    # Execute the original coroutine
+                    original_output = await func(*protected_args, **protected_kwargs)
+                    
+                    return self._finish_protected_call(
+                        args, kwargs, protected_args, protected_kwargs,
+                        original_output, agent_id, session_id, start_ns, scanned
+                    )
+                    
+                except Exception as e:
+                    logger.error(f"Error in protected agent {agent_id}: {str(e)}")
+                    raise
+                finally:
+                    # Clean up session if not persisting
+                    if not self.persistence_enabled:
+                        self._close_session(session_id)
+        else:
+            @functools.wraps(func)
+            def protected_wrapper(*args, **kwargs):
+                # Nothing reads session data when it is neither persisted nor
+                # logged, so skip the IDs, timestamps and session bookkeeping
+                if not self.persistence_enabled and not self.debug_mode:
+                    try:
+                        scanned = {}
+                        protected_args, protected_kwargs = self._protect_arguments(args, kwargs, None, scanned)
+                        return self._protect_output(func(*protected_args, **protected_kwargs), None, scanned)
+                    except Exception as e:
+                        logger.error(f"Error in protected agent {func.__name__}: {str(e)}")
+                        raise
                 
-                return protected_output
+                agent_id, session_id, start_ns = self._open_session()
                 
-            except Exception as e:
-                logger.error(f"Error in protected agent {agent_id}: {str(e)}")
-                raise
-            finally:
-                # Clean up session if not persisting
-                if not self.persistence_enabled:
-                    self.agent_sessions.pop(session_id, None)
+                try:
+                    # Protect input data
+                    scanned = {}
+                    protected_args, protected_kwargs = self._protect_arguments(args, kwargs, session_id, scanned)
+                    
+                    # Execute the original function
+                    original_output = func(*protected_args, **protected_kwargs)
+                    
+                    return self._finish_protected_call(
+                        args, kwargs, protected_args, protected_kwargs,
+                        original_output, agent_id, session_id, start_ns, scanned
+                    )
+                    
+                except Exception as e:
+                    logger.error(f"Error in protected agent {agent_id}: {str(e)}")
+                    raise
+                finally:
+                    # Clean up session if not persisting
+                    if not self.persistence_enabled:
+                        self._close_session(session_id)
         
         return protected_wrapper
 
-    def _protect_input(self, data: Any, session_id: str) -> Any:
-        """Protect input data based on agent configuration."""
-        if isinstance(data, str):
-            return self._protect_text(data, session_id)
-        elif isinstance(data, dict):
-            return {k: self._protect_input(v, session_id) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._protect_input(item, session_id) for item in data]
-        elif isinstance(data, tuple):
-            return tuple(self._protect_input(item, session_id) for item in data)
+    def protect_batch(self, func: Optional[Callable] = None, *,
+                      max_concurrency: int = BATCH_MAX_CONCURRENCY) -> Callable:
+        """
+        Decorator to protect an AI agent function over a batch of inputs.
+        
+        The wrapper takes a list of inputs and calls ``func`` once per input,
+        but opens one session for the batch and protects all inputs, and
+        then all outputs, in a single pass each. Coroutine functions are
+        run concurrently, at most ``max_concurrency`` at a time.
+        
+        Usable bare (``@shield.protect_batch``) or with arguments
+        (``@shield.protect_batch(max_concurrency=5)``).
+        
+        Args:
+            func: The single-input function to protect
+            max_concurrency: Most coroutine calls in flight at once
+            
+        Returns:
+            Protected function wrapper returning a list of outputs
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if func is None:
+            return functools.partial(self.protect_batch, max_concurrency=max_concurrency)
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def protected_batch_wrapper(items):
+                items = list(items)
+                agent_id, session_id, start_ns = self._open_session()
+                
+                try:
+                    scanned = {}
+                    protected_items = self._protect_input(items, session_id, scanned)
+                    
+                    # Bound the fan-out, so a large batch does not start an
+                    # agent (and LLM) call for every item at once
+                    semaphore = asyncio.Semaphore(max_concurrency)
+                    
+                    async def run_one(item):
+                        async with semaphore:
+                            return await func(item)
+                    
+                    outputs = list(await asyncio.gather(*(run_one(item) for item in protected_items)))
+                    
+                    return self._finish_protected_call(
+                        (items,), {}, (protected_items,), {},
+                        outputs, agent_id, session_id, start_ns, scanned
+                    )
+                    
+                except Exception as e:
+                    logger.error(f"Error in protected agent batch {agent_id}: {str(e)}")
+                    raise
+                finally:
+                    if not self.persistence_enabled:
+                        self._close_session(session_id)
         else:
+            @functools.wraps(func)
+            def protected_batch_wrapper(items):
+                items = list(items)
+                agent_id, session_id, start_ns = self._open_session()
+                
+                try:
+                    scanned = {}
+                    protected_items = self._protect_input(items, session_id, scanned)
+                    outputs = [func(item) for item in protected_items]
+                    
+                    return self._finish_protected_call(
+                        (items,), {}, (protected_items,), {},
+                        outputs, agent_id, session_id, start_ns, scanned
+                    )
+                    
+                except Exception as e:
+                    logger.error(f"Error in protected agent batch {agent_id}: {str(e)}")
+                    raise
+                finally:
+                    if not self.persistence_enabled:
+                        self._close_session(session_id)
+        
+        return protected_batch_wrapper
+
+    def _protect_arguments(self, args: tuple, kwargs: Dict[str, Any], session_id: str,
+                           scanned: Dict[int, str]) -> Tuple[tuple, Dict[str, Any]]:
+        """
+        Protect a call's positional and keyword arguments together.
+        
+        Both are walked as one payload, so their strings share a single
+        detection pass instead of one pass each.
+        """
+        if not kwargs:
+            return self._protect_input(args, session_id, scanned), {}
+        return self._protect_input((args, kwargs), session_id, scanned)
+
+    def _open_session(self):
+        """Register a new protection session and return its identifiers."""
+        start_ns = time.perf_counter_ns()
+        agent_id = str(uuid.uuid4())
+        session_id = str(uuid.uuid4())
+        
+        # Store session info
+        self.agent_sessions[session_id] = SessionRecord(
+            session_id=session_id,
+            agent_id=agent_id,
+            agent_type=self._agent_type_str,
+            protection_level=self._protection_level_str,
+            start_time=_iso_now(start_ns)
+        )
+        self._analytics_cache.clear()
+        
+        return agent_id, session_id, start_ns
+
+    def _close_session(self, session_id: str):
+        """Drop a session that is not being persisted."""
+        self.agent_sessions.pop(session_id, None)
+        self._analytics_cache.clear()
+
+    def _finish_protected_call(self, args, kwargs, protected_args, protected_kwargs,
+                               original_output, agent_id, session_id, start_ns, scanned=None):
+        """Protect an agent's output and record the result for its session."""
+        # Protect output data
+        protected_output = self._protect_output(original_output, session_id, scanned)
+        
+        # The protection result only feeds the debug log, so skip
+        # assembling it (and its input/output dicts) otherwise
+        if self.debug_mode:
+            # Calculate processing time
+            processing_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            
+            # Create protection result
+            result = ProtectionResult(
+                original_input={"args": args, "kwargs": kwargs},
+                protected_input={"args": protected_args, "kwargs": protected_kwargs},
+                original_output=original_output,
+                protected_output=protected_output,
+                detected_entities=self._get_detected_entities(session_id),
+                processing_time_ms=processing_time_ms,
+                agent_id=agent_id,
+                session_id=session_id
+            )
+            
+            # Log protection result
+            self._log_protection_result(result)
+        
+        return protected_output
+
+    def _protect_input(self, data: Any, session_id: str, scanned: Optional[Dict[int, str]] = None) -> Any:
+        """
+        Protect input data based on agent configuration.
+
+        Nested dicts, lists and tuples are walked with an explicit stack
+        instead of recursion: each container is copied once and its string
+        leaves are replaced in place, so a payload costs one loop rather
+        than one Python call per node.
+        
+        When a ``scanned`` dict is passed, every protected string is recorded
+        in it by id, and strings already recorded are passed through without
+        scanning them again.
+        
+        String leaves are collected during the walk and scanned together in
+        one pass by ``_protect_texts``.
+        
+        Raises:
+            ValueError: If a container contains itself, directly or nested
+        """
+        kind = _node_kind(type(data))
+        if kind == "str":
+            return self._protect_string(data, session_id, scanned)
+        if kind == "leaf":
             return data
 
-    def _protect_output(self, data: Any, session_id: str) -> Any:
-        """Protect output data based on agent configuration."""
-        return self._protect_input(data, session_id)
+        root = [data]
+        # Tuples are rebuilt as lists while walking and frozen afterwards
+        tuple_slots = []
+        leaf_slots = []
+        # ids of the original containers on the path from the root to the
+        # node being walked; each one is dropped again by its exit marker
+        path = set()
+        stack = [(root, 0)]
+
+        while stack:
+            holder, key = stack.pop()
+            if holder is None:
+                path.discard(key)
+                continue
+            node = holder[key]
+
+            kind = _node_kind(type(node))
+            if kind not in ("str", "leaf"):
+                if id(node) in path:
+                    raise ValueError("Circular reference detected")
+                path.add(id(node))
+                stack.append((None, id(node)))
+
+            if kind == "str":
+                # Compare identity as well as id(), since ids are only unique among live objects
+                if scanned is None or scanned.get(id(node)) is not node:
+                    leaf_slots.append((holder, key))
+            elif kind == "dict":
+                copy = dict(node)
+                holder[key] = copy
+                stack.extend((copy, k) for k in reversed(copy))
+            elif kind != "leaf":
+                copy = list(node)
+                holder[key] = copy
+                if kind == "tuple":
+                    tuple_slots.append((holder, key))
+                stack.extend((copy, i) for i in range(len(copy) - 1, -1, -1))
+
+        if leaf_slots:
+            texts = [holder[key] for holder, key in leaf_slots]
+            protected_texts = self._protect_texts(texts, session_id)
+            for (holder, key), protected_text in zip(leaf_slots, protected_texts):
+                holder[key] = protected_text
+                if scanned is not None:
+                    scanned[id(protected_text)] = protected_text
+
+        # Innermost tuples were recorded last, so freeze them first
+        for holder, key in reversed(tuple_slots):
+            holder[key] = tuple(holder[key])
+
+        return root[0]
+
+    def _protect_output(self, data: Any, session_id: str, scanned: Optional[Dict[int, str]] = None) -> Any:
+        """
+        Protect output data based on agent configuration.
+        
+        Strings the agent passed through untouched from its protected input
+        are found in ``scanned`` and are not scanned a second time.
+        """
+        return self._protect_input(data, session_id, scanned)
+
+    def _protect_string(self, text: str, session_id: str, scanned: Optional[Dict[int, str]]) -> str:
+        """Protect a single string, skipping ones already protected in this call."""
+        if scanned is None:
+            return self._protect_text(text, session_id)
+        
+        # Compare identity as well as id(), since ids are only unique among live objects
+        if scanned.get(id(text)) is text:
+            return text
+        
+        protected_text = self._protect_text(text, session_id)
+        # Keeping the string as the value keeps it alive, so its id cannot be reused
+        scanned[id(protected_text)] = protected_text
+        return protected_text
+
+    def _protect_texts(self, texts: List[str], session_id: str) -> List[str]:
+        """
+        Protect several strings with a single detection pass.
+        
+        The strings are joined with NUL separators, which no detection pattern
+        can match or cross, and the buffer is scanned once. Each match is then
+        assigned back to its string by offset and masked there.
+        """
+        if len(texts) == 1 or any("\x00" in text for text in texts):
+            return [self._protect_text(text, session_id) for text in texts]
+        
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+        
+        leaf_entities = [[] for _ in texts]
+        for entity in self._detect_entities("\x00".join(texts)):
+            index = bisect_right(offsets, entity["start"]) - 1
+            base = offsets[index]
+            entity["start"] -= base
+            entity["end"] -= base
+            leaf_entities[index].append(entity)
+        
+        return [
+            self._mask_entities(text, entities, session_id)
+            for text, entities in zip(texts, leaf_entities)
+        ]
 
     def _protect_text(self, text: str, session_id: str) -> str:
         """Protect text content by detecting and masking sensitive entities."""
@@ -235,12 +624,23 @@ class DataGuardAgentShield:
         
         # Detect entities based on agent type and protection level
         entities = self._detect_entities(text)
+        return self._mask_entities(text, entities, session_id)
+
+    def _mask_entities(self, text: str, entities: List[Dict[str, Any]], session_id: str) -> str:
+        """Record detected entities on the session and mask them in text."""
+        # Store detected entities in session, if one is being tracked
+        session = self.agent_sessions.get(session_id)
+        if session is not None and entities:
+            session.detected_entities.extend(entities)
+            self._analytics_cache.clear()
+        
+        if not entities:
+            return text
         
-        # Store detected entities in session
-        self.agent_sessions[session_id]["detected_entities"].extend(entities)
-        
-        # Apply masking based on protection level
-        protected_text = text
+        # Entities come from one finditer pass, so they are already ordered
+        # and never overlap; splice their masks into the text in a single pass
+        pieces = []
+        cursor = 0
         for entity in entities:
             original_value = entity["value"]
             entity_type = entity["type"]
@@ -251,96 +651,32 @@ class DataGuardAgentShield:
             else:
                 masked_value = self._get_masked_value(original_value, entity_type)
             
-            # Replace in text
-            protected_text = protected_text.replace(original_value, masked_value)
+            pieces.append(text[cursor:entity["start"]])
+            pieces.append(masked_value)
+            cursor = entity["end"]
+        pieces.append(text[cursor:])
         
-        return protected_text
+        return "".join(pieces)
 
     def _detect_entities(self, text: str) -> List[Dict[str, Any]]:
         """Detect sensitive entities in text based on agent configuration."""
         entities = []
         
-        # Get agent-specific rules
-        agent_config = self.agent_configs.get(self.agent_type, {})
-        
-        # Email addresses
-        if agent_config.get("protect_email_addresses", True):
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            for match in re.finditer(email_pattern, text):
-                entities.append({
-                    "type": "email",
-                    "value": match.group(),
-                    "start": match.start(),
-                    "end": match.end()
-                })
-        
-        # Phone numbers
-        if agent_config.get("protect_phone_numbers", True):
-            phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-            for match in re.finditer(phone_pattern, text):
-                entities.append({
-                    "type": "phone",
-                    "value": match.group(),
-                    "start": match.start(),
-                    "end": match.end()
-                })
-        
-        # Credit card numbers
-        if agent_config.get("protect_credit_card_data", True) or agent_config.get("protect_payment_info", True):
-            cc_pattern = r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'
-            for match in re.finditer(cc_pattern, text):
-                entities.append({
-                    "type": "credit_card",
-                    "value": match.group(),
-                    "start": match.start(),
-                    "end": match.end()
-                })
-        
-        # Social Security Numbers
-        ssn_pattern = r'\b\d{3}-\d{2}-\d{4}\b'
-        for match in re.finditer(ssn_pattern, text):
+        for match in self._detection_pattern.finditer(text):
+            entity_type = match.lastgroup
+            value = match.group()
+            
+            # Avoid matching phone numbers as account numbers
+            if entity_type == "account_number" and PHONE_PATTERN.match(value):
+                continue
+            
             entities.append({
-                "type": "ssn",
-                "value": match.group(),
+                "type": entity_type,
+                "value": value,
                 "start": match.start(),
                 "end": match.end()
             })
         
-        # Account numbers (basic pattern)
-        if agent_config.get("protect_account_numbers", True):
-            account_pattern = r'\b\d{8,12}\b'
-            for match in re.finditer(account_pattern, text):
-                # Avoid matching phone numbers and other patterns
-                if not re.match(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', match.group()):
-                    entities.append({
-                        "type": "account_number",
-                        "value": match.group(),
-                        "start": match.start(),
-                        "end": match.end()
-                    })
-        
-        # API Keys
-        if agent_config.get("protect_api_keys", True):
-            api_key_pattern = r'sk-[a-zA-Z0-9]{32,}'
-            for match in re.finditer(api_key_pattern, text):
-                entities.append({
-                    "type": "api_key",
-                    "value": match.group(),
-                    "start": match.start(),
-                    "end": match.end()
-                })
-        
-        # Database URLs
-        if agent_config.get("protect_database_credentials", True):
-            db_url_pattern = r'[a-zA-Z]+://[^/\\s]+:[^/\\s]+@[^/\\s]+'
-            for match in re.finditer(db_url_pattern, text):
-                entities.append({
-                    "type": "database_url",
-                    "value": match.group(),
-                    "start": match.start(),
-                    "end": match.end()
-                })
-        
         return entities
 
     def _get_persistent_mapping(self, original_value: str, entity_type: str, session_id: str) -> str:
@@ -388,39 +724,64 @@ class DataGuardAgentShield:
 
     def _get_detected_entities(self, session_id: str) -> List[Dict[str, Any]]:
         """Get detected entities for a session."""
-        session = self.agent_sessions.get(session_id, {})
-        return session.get("detected_entities", [])
+        session = self.agent_sessions.get(session_id)
+        return session.detected_entities if session is not None else []
 
     def _log_protection_result(self, result: ProtectionResult):
         """Log protection result for monitoring and analytics."""
-        if self.debug_mode:
-            logger.info(f"SecureAI Protection Result:")
-            logger.info(f"  Agent ID: {result.agent_id}")
-            logger.info(f"  Session ID: {result.session_id}")
-            logger.info(f"  Processing Time: {result.processing_time_ms:.2f}ms")
-            logger.info(f"  Detected Entities: {len(result.detected_entities)}")
-            
-            for entity in result.detected_entities:
-                logger.info(f"    - {entity['type']}: {entity['value']}")
+        if not self.debug_mode or not logger.isEnabledFor(logging.INFO):
+            return
+        
+        entity_lines = "".join(
+            f"\n    - {entity['type']}: {entity['value']}"
+            for entity in result.detected_entities
+        )
+        logger.info(
+            "SecureAI Protection Result:\n"
+            "  Agent ID: %s\n"
+            "  Session ID: %s\n"
+            "  Processing Time: %.2fms\n"
+            "  Detected Entities: %d%s",
+            result.agent_id,
+            result.session_id,
+            result.processing_time_ms,
+            len(result.detected_entities),
+            entity_lines
+        )
 
     def get_agent_analytics(self, agent_id: str = None, session_id: str = None) -> Dict[str, Any]:
-        """Get analytics for agent protection."""
+        """
+        Get analytics for agent protection.
+        
+        Results are memoized per filter until the sessions change, and each
+        call returns a fresh copy so callers may modify it.
+        """
+        cache_key = (agent_id, session_id)
+        analytics = self._analytics_cache.get(cache_key)
+        if analytics is None:
+            analytics = self._compute_agent_analytics(agent_id, session_id)
+            self._analytics_cache[cache_key] = analytics
+        
+        return {**analytics, "entity_breakdown": dict(analytics["entity_breakdown"])}
+
+    def _compute_agent_analytics(self, agent_id: Optional[str], session_id: Optional[str]) -> Dict[str, Any]:
+        """Build analytics by walking the recorded sessions."""
         analytics = {
             "total_sessions": len(self.agent_sessions),
             "total_entities_detected": 0,
             "entity_breakdown": {},
-            "protection_level": self.protection_level.value,
-            "agent_type": self.agent_type.value
+            "protection_level": self._protection_level_str,
+            "agent_type": self._agent_type_str
         }
         
         # Calculate entity breakdown
         for session_data in self.agent_sessions.values():
-            if agent_id and session_data.get("agent_id") != agent_id:
+            if agent_id and session_data.agent_id != agent_id:
                 continue
-            if session_id and session_data.get("session_id") != session_id:
+            if session_id and session_data.session_id != session_id:
                 continue
             
-            entities = session_data.get("detected_entities", [])
+            entities = session_data.detected_entities
             analytics["total_entities_detected"] += len(entities)
             
             for entity in entities:
@@ -434,14 +795,17 @@ def create_agent_shield(agent_type: AgentType = AgentType.CUSTOMER_SERVICE,
     """
     Factory function to create an AI agent shield.
     
+    Shields for the same agent type share one compiled detection pattern,
+    so creating several costs no regex compilation after the first.
+    
     Args:
         agent_type: Type of agent to protect
         protection_level: Level of protection to apply
         
     Returns:
-        Configured SecureAI Agent Shield
+        Configured DataGuard Agent Shield
     """
-    return SecureAIAgentShield(
+    return DataGuardAgentShield(
         agent_type=agent_type,
         protection_level=protection_level,
         persistence_enabled=True
@@ -456,9 +820,10 @@ if __name__ == "__main__":
         debug_mode=True
     ).protect_agent
     def customer_service_agent(customer_data):
-        customer_name = customer_data.get("name", "Unknown")
-        customer_email = customer_data.get("email", "unknown@example.com")
-        customer_phone = customer_data.get("phone", "555-0000")
+        get = customer_data.get
+        customer_name = get("name", "Unknown")
+        customer_email = get("email", "unknown@example.com")
+        customer_phone = get("phone", "555-0000")
         
         response = f"Hello {customer_name}, I can help you with your inquiry. I'll contact you at {customer_email} or {customer_phone}."
         return response
@@ -8,7 +8,7 @@ import os
 import sys
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from contextlib import asynccontextmanager
 
 # Add src directory to Python path
@@ -17,12 +17,20 @@ sys.path.insert(0, str(Path(__file__).parent))
 from fastapi import FastAPI, HTTPException, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 import uvicorn
 from dotenv import load_dotenv
 
+# Serialize responses (health reports included) with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Import SecureAI components
 from secure_AI.proxy_redaction_service import ProxyRedactionService
 from secure_AI.ai_privacy_shield import AIPrivacyShield
@@ -46,6 +54,9 @@ logger = logging.getLogger(__name__)
 # Security
 security = HTTPBearer(auto_error=False)
 
+# Most items accepted in one /api/redact_batch request
+MAX_BATCH_ITEMS = int(os.getenv("MAX_BATCH_ITEMS", "100"))
+
 # Global service instances
 proxy_service: Optional[ProxyRedactionService] = None
 ai_shield: Optional[AIPrivacyShield] = None
@@ -67,6 +78,14 @@ class RedactResponse(BaseModel):
     cached: bool = False
     error: Optional[str] = None
 
+class BatchRedactRequest(BaseModel):
+    items: List[RedactRequest] = Field(
+        ..., max_length=MAX_BATCH_ITEMS, description="Content items to redact"
+    )
+
+class BatchRedactResponse(BaseModel):
+    results: List[RedactResponse]
+
 class HealthResponse(BaseModel):
     status: str
     services: Dict[str, str]
@@ -128,7 +147,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 # Add middleware
@@ -246,6 +266,68 @@ async def redact_content(
         logger.error(f"Redaction failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _redacted_content(result: Dict[str, Any]) -> Optional[str]:
+    """Pull the redacted text out of a proxy result, or None if it has none."""
+    if "redacted_content" in result:
+        return result["redacted_content"]
+    redaction_result = result.get("redaction_result") or {}
+    for key in ("redacted_text", "redacted_code"):
+        if key in redaction_result:
+            return redaction_result[key]
+    return None
+
+@app.post("/api/redact_batch", response_model=BatchRedactResponse)
+async def redact_batch(
+    request: BatchRedactRequest,
+    user_id: str = Depends(check_rate_limit)
+):
+    """Redact several items in one request, returning results in order."""
+    if not proxy_service:
+        raise HTTPException(status_code=503, detail="Service not available")
+    
+    try:
+        import time
+        results = []
+        
+        for item in request.items:
+            start_time = time.time()
+            
+            # Redaction blocks, so keep it off the event loop
+            result = await run_in_threadpool(
+                proxy_service.redact_content,
+                content=item.content,
+                content_type=item.content_type,
+                user_identifier=user_id,
+                use_cache=item.use_cache
+            )
+            processing_time = (time.time() - start_time) * 1000
+            
+            # A failed item never echoes its unredacted content back
+            redacted_content = _redacted_content(result)
+            if not result.get("success") or redacted_content is None:
+                results.append(RedactResponse(
+                    success=False,
+                    redacted_content="",
+                    redaction_summary={},
+                    processing_time_ms=processing_time,
+                    error=result.get("error", "Redaction failed")
+                ))
+                continue
+            
+            results.append(RedactResponse(
+                success=True,
+                redacted_content=redacted_content,
+                redaction_summary=result.get("summary", {}),
+                processing_time_ms=processing_time,
+                cached=result.get("cached", False)
+            ))
+        
+        return BatchRedactResponse(results=results)
+        
+    except Exception as e:
+        logger.error(f"Batch redaction failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/redact/advanced", response_model=RedactResponse)
 async def advanced_redact(
     request: RedactRequest,
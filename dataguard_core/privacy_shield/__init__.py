@@ -1,20 +1,29 @@
+import importlib
+import sys
+
+# redact_text and redact_content share their names with the submodules that
+# define them. Importing such a submodule directly rebinds the package
+# attribute to the module, so these are imported eagerly, which leaves the
+# function in place; the rest of this group comes in with redact_content.
 from .redact_per_pdf import redact_pdf
 from .redact_text import redact_text
 from .redact_code import redact_code_file
 from .redact_content import redact_content, get_supported_formats
-from .ai_privacy_shield import DataGuardPrivacyShield, DataGuardEnterprisePrivacyAPI
-from .enhanced_detection import EnhancedDetection
-from .advanced_masking import AdvancedMasking, MaskingStrategy
 
-try:
-    import importlib.metadata
-    __version__ = importlib.metadata.version("dataguard")
-except ImportError:
-    __version__ = "unknown"
+# Public names and the submodules that define them. Submodules are imported
+# on first attribute access (PEP 562), so importing the package does not
+# pull in the AI shield stack (Redis, PostgreSQL) until it is actually used.
+_LAZY_ATTRS = {
+    "DataGuardPrivacyShield": "ai_privacy_shield",
+    "DataGuardEnterprisePrivacyAPI": "ai_privacy_shield",
+    "EnhancedDetection": "enhanced_detection",
+    "AdvancedMasking": "advanced_masking",
+    "MaskingStrategy": "advanced_masking",
+}
 
 __all__ = [
     "redact_pdf",
-    "redact_text", 
+    "redact_text",
     "redact_code_file",
     "redact_content",
     "get_supported_formats",
@@ -24,3 +33,38 @@ __all__ = [
     "AdvancedMasking",
     "MaskingStrategy"
 ]
+
+
+def _compute_version():
+    """Look up the installed distribution's version."""
+    try:
+        import importlib.metadata
+        return importlib.metadata.version("dataguard")
+    except ImportError:
+        return "unknown"
+
+
+def __getattr__(name):
+    if name == "__version__":
+        # Resolved on first access, since looking up distribution metadata
+        # scans site-packages
+        version = _compute_version()
+        globals()["__version__"] = version
+        return version
+    
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    importlib.import_module(f".{module_name}", __name__)
+    # Cache every name from loaded submodules on the package, so later lookups
+    # skip __getattr__
+    for attr, source in _LAZY_ATTRS.items():
+        module = sys.modules.get(f"{__name__}.{source}")
+        # A submodule still being imported may not define its names yet
+        if module is not None and hasattr(module, attr):
+            globals()[attr] = getattr(module, attr)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
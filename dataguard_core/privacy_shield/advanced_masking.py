@@ -142,10 +142,18 @@ class AdvancedMasking:
         
         all_values.sort(key=lambda x: len(x[0]), reverse=True)
         
+        # Lowercased copy for a cheap substring check before running the regex.
+        # Only kept for ASCII content, where lower() agrees with re.IGNORECASE.
+        folded = masked_content.lower() if masked_content.isascii() else None
+        
         for value, data_type in all_values:
             if not value or not value.strip():
                 continue
             
+            # Skip values that cannot occur in the content
+            if folded is not None and value.isascii() and value.lower() not in folded:
+                continue
+            
             # Create mask
             mask = self.mask_value(value, data_type)
             
@@ -155,6 +163,7 @@ class AdvancedMasking:
             
             if matches:
                 masked_content = pattern.sub(mask, masked_content)
+                folded = masked_content.lower() if masked_content.isascii() else None
                 redaction_count += len(matches)
                 redacted_items.append({
                     "original": value,
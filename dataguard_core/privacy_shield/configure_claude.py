@@ -1,15 +1,46 @@
 import os
+import sys
 import json
-import subprocess
+import importlib.util
 import platform
 import time
 import re
+from pathlib import Path
 
-# Python version check
-python_path = subprocess.check_output(['which', 'python'], text=True).strip()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _config_json(config):
+    """Serialize the config to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode()
+
+def _load_config(data):
+    """Parse JSON config bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _emit_config(config):
+    """Write the config to stdout as UTF-8 JSON in a single write."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_config_json(config) + b"\n")
+    sys.stdout.flush()
+
+# Python interpreter: the running one is what the MCP server should use,
+# so there is no need to spawn `which python` to find it
+python_path = sys.executable
 
 # MCP and Tinfoil
-mcp_script_path = subprocess.check_output(['python', '-c', 'import secureai as m; print(f"{m.__path__[0]}/mcp_universal_redaction.py")'], text=True).strip()
+# Locate the installed package in-process rather than starting a second
+# interpreter and capturing its output; find_spec does not import it
+secureai_spec = importlib.util.find_spec('secureai')
+if secureai_spec is None or not secureai_spec.submodule_search_locations:
+    raise ModuleNotFoundError("No module named 'secureai'")
+mcp_script_path = f"{secureai_spec.submodule_search_locations[0]}/mcp_universal_redaction.py"
 print("--------------------------------\n")
 tinfoil_api_key = input("💡 Enter your Tinfoil API key: ")
 
@@ -44,7 +75,7 @@ if access_to_config not in ["y", "Y", "yes", "Yes", "YES"]:
     time.sleep(1)
     print("❌ Copy the following configuration into your Claude config JSON file:")
     time.sleep(1)
-    print(json.dumps(claude_config, indent=2))
+    _emit_config(claude_config)
     exit()
 
 # Check if config directory exists
@@ -53,12 +84,11 @@ if os.path.exists(config_dir):
     config_path = os.path.join(config_dir, config_filename)
 
     if os.path.exists(config_path):
-        # Read existing config
-        with open(config_path, 'r') as f:
-            try:
-                existing_config = json.load(f)
-            except json.JSONDecodeError:
-                existing_config = {}
+        # Read existing config in one call, without a buffered text reader
+        try:
+            existing_config = _load_config(Path(config_path).read_bytes())
+        except ValueError:
+            existing_config = {}
         
         # Merge with new config
         if "mcpServers" not in existing_config:
@@ -67,8 +97,7 @@ if os.path.exists(config_dir):
         claude_config = existing_config
 
     # Write to file
-    with open(config_path, 'w') as f:
-        json.dump(claude_config, f, indent=2)
+    Path(config_path).write_bytes(_config_json(claude_config))
         
     print("✅ Configuration successfully added to Claude config file!")
     time.sleep(1)
@@ -82,4 +111,4 @@ else:
     time.sleep(1)
     print("❌ Copy the following configuration into your Claude config JSON file:")
     time.sleep(1)
-    print(json.dumps(claude_config, indent=2))
+    _emit_config(claude_config)
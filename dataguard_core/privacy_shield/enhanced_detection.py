@@ -17,16 +17,25 @@ class EnhancedDetection:
             'phone': r'\b(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b',
             'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
             'credit_card': r'\b\d{4}[-.\s]?\d{4}[-.\s]?\d{4}[-.\s]?\d{4}\b',
-            'api_key': r'\b(sk-|pk-|ghp_|gho_|ghu_|ghs_|ghr_)[a-zA-Z0-9]{20,}\b',
+            'api_key': r'(?i)\b(sk-|pk-|ghp_|gho_|ghu_|ghs_|ghr_)[a-zA-Z0-9]{20,}\b',
             'jwt_token': r'\beyJ[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*\b',
-            'uuid': r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b',
+            'uuid': r'\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b',
             'ip_address': r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
             'mac_address': r'\b([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})\b',
-            'database_url': r'\b(postgresql|mysql|mongodb|redis)://[^\s]+\b',
+            'database_url': r'(?i)\b(postgresql|mysql|mongodb|redis)://[^\s]+\b',
             'aws_key': r'\bAKIA[0-9A-Z]{16}\b',
             'private_key': r'-----BEGIN (RSA |DSA |EC )?PRIVATE KEY-----',
             'public_key': r'-----BEGIN (RSA |DSA |EC )?PUBLIC KEY-----',
         }
+        
+        # Compiled once here rather than looked up by re.findall on every call.
+        # Patterns whose classes already spell out both cases, and tokens whose
+        # format fixes the case (JWT "eyJ", AWS "AKIA", PEM headers), are
+        # compiled case-sensitively; the rest carry an inline (?i) flag.
+        self._compiled_patterns = [
+            (data_type, re.compile(pattern))
+            for data_type, pattern in self.patterns.items()
+        ]
     
     def detect_with_patterns(self, text: str) -> Dict[str, List[str]]:
         """
@@ -34,8 +43,8 @@ class EnhancedDetection:
         """
         detected = {}
         
-        for data_type, pattern in self.patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for data_type, pattern in self._compiled_patterns:
+            matches = pattern.findall(text)
             if matches:
                 detected[data_type] = list(set(matches))
         
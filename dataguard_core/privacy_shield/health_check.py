@@ -5,45 +5,103 @@ Provides comprehensive health monitoring and status reporting.
 
 import os
 import time
-import psutil
+import functools
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable
 from datetime import datetime, timedelta
-import requests
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# How long dependency check results are reused before checking again
+CHECK_CACHE_TTL = 5.0
+
+# How long check_health waits for any single service or dependency check
+CHECK_TIMEOUT = 3.0
+
+def _cached_check(method):
+    """
+    Reuse a health check method's result for CHECK_CACHE_TTL seconds.
+    
+    Cached methods take no arguments, so each keeps just its latest result.
+    Callers that report their own check time stamp it on a copy afterwards.
+    """
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self):
+        cached = self._check_cache.get(name)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        # Checks run on several workers at once, so callers that miss
+        # together wait for one check rather than each running their own
+        with self._check_locks.setdefault(name, threading.Lock()):
+            now = time.monotonic()
+            cached = self._check_cache.get(name)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            result = method(self)
+            self._check_cache[name] = (now + CHECK_CACHE_TTL, result)
+            return result
+    return wrapper
+
 class HealthChecker:
     """Comprehensive health checker for SecureAI services."""
     
     def __init__(self):
         self.start_time = time.time()
-        self.health_history: List[Dict[str, Any]] = []
         self.max_history_size = 100
+        # Bounded history; the oldest entry is evicted in O(1) once full
+        self.health_history: deque = deque(maxlen=self.max_history_size)
+        
+        # Recent dependency check results, by method name, as (expiry, result)
+        self._check_cache: Dict[str, Any] = {}
+        self._check_locks: Dict[str, threading.Lock] = {}
+        
+        # Keep-alive session for probing the local API, created on first use
+        self._session = None
+        
+        # Shared workers for running service and dependency checks side by side
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-check")
+        
+        # psutil and requests are imported on first use, so importing this
+        # module (and the global instance below) stays cheap
+        self._cpu_primed = False
         
     def check_health(self) -> Dict[str, Any]:
         """Perform comprehensive health check."""
+        # Read the clock once, so every timestamp in this check agrees
+        now = time.time()
+        timestamp = datetime.fromtimestamp(now).isoformat()
         try:
+            # Start the service and dependency checks together, since each
+            # may block on the network; the wait is then the slowest check
+            service_futures = self._submit_checks({
+                "api": self._check_api_health,
+                "database": functools.partial(self._check_database_health, timestamp),
+                "cache": self._check_cache_health,
+                "external_apis": functools.partial(self._check_external_apis, timestamp)
+            })
+            dependency_futures = self._submit_checks(self._dependency_checks(timestamp))
+            
             health_status = {
                 "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "uptime": time.time() - self.start_time,
+                "timestamp": timestamp,
+                "uptime": now - self.start_time,
                 "version": "1.0.0",
                 "services": {},
                 "system": self._check_system_health(),
-                "dependencies": self._check_dependencies(),
+                "dependencies": self._collect_checks(dependency_futures),
                 "performance": self._check_performance(),
                 "errors": []
             }
             
             # Check individual services
-            health_status["services"] = {
-                "api": self._check_api_health(),
-                "database": self._check_database_health(),
-                "cache": self._check_cache_health(),
-                "external_apis": self._check_external_apis()
-            }
+            health_status["services"] = self._collect_checks(service_futures)
             
             # Determine overall status
             if any(service.get("status") == "unhealthy" for service in health_status["services"].values()):
@@ -61,8 +119,8 @@ class HealthChecker:
             logger.error(f"Health check failed: {e}")
             return {
                 "status": "unhealthy",
-                "timestamp": datetime.now().isoformat(),
-                "uptime": time.time() - self.start_time,
+                "timestamp": timestamp,
+                "uptime": now - self.start_time,
                 "version": "1.0.0",
                 "services": {},
                 "system": {},
@@ -74,7 +132,15 @@ class HealthChecker:
     def _check_system_health(self) -> Dict[str, Any]:
         """Check system resources."""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            import psutil
+            
+            if self._cpu_primed:
+                # Usage since the previous call, without sleeping to sample it
+                cpu_percent = psutil.cpu_percent(interval=None)
+            else:
+                # The first read has no previous sample, so take a short one
+                cpu_percent = psutil.cpu_percent(interval=0.1)
+                self._cpu_primed = True
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
@@ -90,30 +156,47 @@ class HealthChecker:
             logger.error(f"System health check failed: {e}")
             return {"error": str(e)}
     
-    def _check_dependencies(self) -> Dict[str, Any]:
-        """Check external dependencies."""
+    def _dependency_checks(self, timestamp: str) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """External dependency checks to run, by name."""
         dependencies = {}
         
         # Check Tinfoil API
         tinfoil_api_key = os.getenv("TINFOIL_API_KEY")
         if tinfoil_api_key:
-            dependencies["tinfoil_api"] = self._check_tinfoil_api()
+            dependencies["tinfoil_api"] = functools.partial(self._check_tinfoil_api_at, timestamp)
         else:
-            dependencies["tinfoil_api"] = {"status": "not_configured"}
+            dependencies["tinfoil_api"] = lambda: {"status": "not_configured"}
         
         # Check database connectivity
-        dependencies["database"] = self._check_database_connectivity()
+        dependencies["database"] = self._check_database_connectivity
         
         # Check Redis connectivity
-        dependencies["redis"] = self._check_redis_connectivity()
+        dependencies["redis"] = self._check_redis_connectivity
         
         return dependencies
     
+    def _submit_checks(self, checks: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, Future]:
+        """Start checks on the shared executor."""
+        return {name: self._executor.submit(check) for name, check in checks.items()}
+    
+    def _collect_checks(self, futures: Dict[str, Future]) -> Dict[str, Any]:
+        """Wait for submitted checks, reporting failures and timeouts as unhealthy."""
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=CHECK_TIMEOUT)
+            except Exception as e:
+                results[name] = {
+                    "status": "unhealthy",
+                    "error": str(e) or type(e).__name__
+                }
+        return results
+    
     def _check_performance(self) -> Dict[str, Any]:
         """Check performance metrics."""
         try:
             # Get recent health history for performance analysis
-            recent_checks = self.health_history[-10:] if self.health_history else []
+            recent_checks = self._recent_history(10)
             
             avg_response_time = 0
             if recent_checks:
@@ -129,11 +212,24 @@ class HealthChecker:
             logger.error(f"Performance check failed: {e}")
             return {"error": str(e)}
     
+    def _get_session(self):
+        """Return the keep-alive session for probing the local API."""
+        if self._session is None:
+            import requests
+            
+            # One pooled connection is reused by every check instead of
+            # opening a new socket each time
+            session = requests.Session()
+            session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            self._session = session
+        return self._session
+    
+    @_cached_check
     def _check_api_health(self) -> Dict[str, Any]:
         """Check internal API health."""
         try:
             # Check if main application is responding
-            response = requests.get("http://localhost:8000/", timeout=5)
+            response = self._get_session().get("http://localhost:8000/", timeout=2)
             return {
                 "status": "healthy" if response.status_code == 200 else "unhealthy",
                 "response_time": response.elapsed.total_seconds() * 1000,
@@ -145,7 +241,7 @@ class HealthChecker:
                 "error": str(e)
             }
     
-    def _check_database_health(self) -> Dict[str, Any]:
+    def _check_database_health(self, timestamp: str) -> Dict[str, Any]:
         """Check database health."""
         try:
             # This would check your actual database connection
@@ -153,7 +249,7 @@ class HealthChecker:
             return {
                 "status": "healthy",
                 "connection_pool": "active",
-                "last_query_time": datetime.now().isoformat()
+                "last_query_time": timestamp
             }
         except Exception as e:
             return {
@@ -177,17 +273,25 @@ class HealthChecker:
                 "error": str(e)
             }
     
-    def _check_external_apis(self) -> Dict[str, Any]:
+    def _check_external_apis(self, timestamp: str) -> Dict[str, Any]:
         """Check external API health."""
         apis = {}
         
         # Check Tinfoil API
         tinfoil_api_key = os.getenv("TINFOIL_API_KEY")
         if tinfoil_api_key:
-            apis["tinfoil"] = self._check_tinfoil_api()
+            apis["tinfoil"] = self._check_tinfoil_api_at(timestamp)
         
         return apis
     
+    def _check_tinfoil_api_at(self, timestamp: str) -> Dict[str, Any]:
+        """Check Tinfoil API connectivity, reporting the caller's check time."""
+        # The cached result is shared, so the time goes on a copy
+        result = dict(self._check_tinfoil_api())
+        result["last_check"] = timestamp
+        return result
+    
+    @_cached_check
     def _check_tinfoil_api(self) -> Dict[str, Any]:
         """Check Tinfoil API connectivity."""
         try:
@@ -195,8 +299,7 @@ class HealthChecker:
             # For now, return a mock status
             return {
                 "status": "healthy",
-                "response_time": 150,  # ms
-                "last_check": datetime.now().isoformat()
+                "response_time": 150  # ms
             }
         except Exception as e:
             return {
@@ -204,6 +307,7 @@ class HealthChecker:
                 "error": str(e)
             }
     
+    @_cached_check
     def _check_database_connectivity(self) -> Dict[str, Any]:
         """Check database connectivity."""
         try:
@@ -219,6 +323,7 @@ class HealthChecker:
                 "error": str(e)
             }
     
+    @_cached_check
     def _check_redis_connectivity(self) -> Dict[str, Any]:
         """Check Redis connectivity."""
         try:
@@ -237,6 +342,7 @@ class HealthChecker:
     def _get_load_average(self) -> List[float]:
         """Get system load average."""
         try:
+            import psutil
             return list(psutil.getloadavg())
         except Exception:
             return [0, 0, 0]
@@ -262,14 +368,15 @@ class HealthChecker:
     def _store_health_status(self, status: Dict[str, Any]):
         """Store health status in history."""
         self.health_history.append(status)
-        
-        # Keep only recent history
-        if len(self.health_history) > self.max_history_size:
-            self.health_history = self.health_history[-self.max_history_size:]
+    
+    def _recent_history(self, limit: int) -> List[Dict[str, Any]]:
+        """Return up to the last `limit` history entries, oldest first."""
+        start = max(0, len(self.health_history) - limit)
+        return list(itertools.islice(self.health_history, start, None))
     
     def get_health_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent health history."""
-        return self.health_history[-limit:] if self.health_history else []
+        return self._recent_history(limit)
     
     def get_uptime(self) -> float:
         """Get service uptime in seconds."""
@@ -293,13 +400,16 @@ class HealthChecker:
 class HealthMetrics:
     """Health metrics collector for Prometheus."""
     
-    def __init__(self):
-        self.metrics = {}
+    def __init__(self, max_samples: int = 10_000):
+        # Each metric keeps only its most recent samples, so a long-running
+        # process does not grow without bound
+        self.max_samples = max_samples
+        self.metrics: Dict[str, deque] = {}
     
     def record_metric(self, name: str, value: float, labels: Dict[str, str] = None):
         """Record a metric."""
         if name not in self.metrics:
-            self.metrics[name] = []
+            self.metrics[name] = deque(maxlen=self.max_samples)
         
         metric = {
             "value": value,
@@ -310,11 +420,11 @@ class HealthMetrics:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get all metrics."""
-        return self.metrics
+        return {name: list(samples) for name, samples in self.metrics.items()}
     
     def get_metric(self, name: str) -> List[Dict[str, Any]]:
         """Get specific metric."""
-        return self.metrics.get(name, [])
+        return list(self.metrics.get(name, ()))
 
 # Global health checker instance
 health_checker = HealthChecker()
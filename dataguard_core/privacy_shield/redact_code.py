@@ -40,6 +40,9 @@ CODE_EXTENSIONS = {
     '.docker': 'dockerfile'
 }
 
+# Largest code file sent for redaction; bigger files are generated or data
+MAX_CODE_FILE_SIZE = 16 * 1024 * 1024
+
 
 def detect_language(file_path: str) -> str:
     """
@@ -66,15 +69,26 @@ def read_code_file(file_path: str) -> str:
         File content as string
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except Exception as e:
+        raise Exception(f"Could not read file {file_path}: {str(e)}")
+    
+    # A NUL byte near the start means a binary file with a code extension
+    if b'\x00' in raw[:512]:
+        raise Exception(f"Could not read file {file_path}: binary content")
+    
+    # Decode the bytes already read rather than reopening the file, trying
+    # a different encoding if it is not UTF-8
+    try:
+        text = raw.decode('utf-8')
     except UnicodeDecodeError:
-        # Try with different encoding
-        try:
-            with open(file_path, 'r', encoding='latin-1') as f:
-                return f.read()
-        except Exception as e:
-            raise Exception(f"Could not read file {file_path}: {str(e)}")
+        text = raw.decode('latin-1')
+    
+    # Normalize newlines as text mode would
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def mask_code_content(code: str, sensitive_values: List[str], language: str) -> Dict[str, Any]:
@@ -96,8 +110,16 @@ def mask_code_content(code: str, sensitive_values: List[str], language: str) ->
     # Sort sensitive values by length (longest first) to avoid partial matches
     sorted_values = sorted(sensitive_values, key=len, reverse=True)
     
+    # Lowercased copy for a cheap substring check before running the regex.
+    # Only kept for ASCII text, where lower() agrees with re.IGNORECASE.
+    folded = redacted_code.lower() if redacted_code.isascii() else None
+    
     for value in sorted_values:
         if value and value.strip():
+            # Skip values that cannot occur in the text
+            if folded is not None and value.isascii() and value.lower() not in folded:
+                continue
+            
             # Create a mask for this value
             if '@' in value:  # Email address
                 username, domain = value.split('@')
@@ -115,6 +137,7 @@ def mask_code_content(code: str, sensitive_values: List[str], language: str) ->
             matches = pattern.findall(redacted_code)
             if matches:
                 redacted_code = pattern.sub(mask, redacted_code)
+                folded = redacted_code.lower() if redacted_code.isascii() else None
                 redaction_count += len(matches)
                 redacted_items.append({
                     "original": value,
@@ -148,9 +171,29 @@ def save_redacted_code(original_path: str, redacted_code: str) -> str:
         base_path, ext = os.path.splitext(original_path)
         redacted_path = f"{base_path}_redacted{ext}"
         
-        # Save redacted code
-        with open(redacted_path, 'w', encoding='utf-8') as f:
-            f.write(redacted_code)
+        # Match text-mode newline translation, then write the encoded file in
+        # one go to a temporary path and move it into place, so a failed save
+        # never leaves a half-written redacted file behind
+        if os.linesep != "\n":
+            redacted_code = redacted_code.replace("\n", os.linesep)
+        data = memoryview(redacted_code.encode('utf-8'))
+        
+        tmp_path = f"{redacted_path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, redacted_path)
+        except BaseException:
+            # Drop the partial temporary file, whichever step failed
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
         
         return redacted_path
     except Exception as e:
@@ -183,6 +226,13 @@ def redact_code_file(file_path: str, tinfoil_llm) -> Dict[str, Any]:
             "error": f"Unsupported file type: {file_path}"
         }
     
+    # Skip oversized files before reading or sending anything to the model
+    if os.path.getsize(file_path) > MAX_CODE_FILE_SIZE:
+        return {
+            "success": False,
+            "error": f"File too large to redact: {file_path}"
+        }
+    
     try:
         # Read code file
         code_content = read_code_file(file_path)
@@ -21,8 +21,16 @@ def mask_text_content(text: str, sensitive_values: List[str]) -> Dict[str, Any]:
     # Sort sensitive values by length (longest first) to avoid partial matches
     sorted_values = sorted(sensitive_values, key=len, reverse=True)
     
+    # Lowercased copy for a cheap substring check before running the regex.
+    # Only kept for ASCII text, where lower() agrees with re.IGNORECASE.
+    folded = redacted_text.lower() if redacted_text.isascii() else None
+    
     for value in sorted_values:
         if value and value.strip():
+            # Skip values that cannot occur in the text
+            if folded is not None and value.isascii() and value.lower() not in folded:
+                continue
+            
             # Create a mask for this value
             if '@' in value:  # Email address
                 username, domain = value.split('@')
@@ -40,6 +48,7 @@ def mask_text_content(text: str, sensitive_values: List[str]) -> Dict[str, Any]:
             matches = pattern.findall(redacted_text)
             if matches:
                 redacted_text = pattern.sub(mask, redacted_text)
+                folded = redacted_text.lower() if redacted_text.isascii() else None
                 redaction_count += len(matches)
                 redacted_items.append({
                     "original": value,
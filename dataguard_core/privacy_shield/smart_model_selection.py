@@ -10,6 +10,35 @@ import re
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
+# Content signals, each combined into one alternation so a single search
+# answers whether any of its patterns occur
+CODE_PATTERN = re.compile('|'.join([
+    r'def\s+\w+\s*\(',           # Python functions
+    r'function\s+\w+\s*\(',      # JavaScript functions
+    r'class\s+\w+',              # Classes
+    r'import\s+\w+',             # Imports
+    r'const\s+\w+\s*=',          # Constants
+    r'var\s+\w+\s*=',            # Variables
+    r'if\s*\(',                  # Conditionals
+    r'for\s*\(',                 # Loops
+    r'api_key\s*=',              # API keys
+    r'password\s*=',             # Passwords
+    r'database_url\s*=',         # Database URLs
+]), re.IGNORECASE)
+
+TECHNICAL_PATTERN = re.compile('|'.join([
+    r'\b(api|sdk|endpoint|microservice|kubernetes|docker|aws|azure|gcp)\b',
+    r'\b(database|server|client|protocol|algorithm|framework)\b',
+    r'\b(encryption|authentication|authorization|ssl|tls)\b'
+]), re.IGNORECASE)
+
+FINANCIAL_PATTERN = re.compile('|'.join([
+    r'\$\d+',                    # Dollar amounts
+    r'\b\d+\.\d{2}\b',           # Decimal amounts
+    r'\b(contract|invoice|payment|budget|revenue|profit)\b',
+    r'\b(account|bank|credit|debit|transaction)\b'
+]), re.IGNORECASE)
+
 class ModelType(Enum):
     """Available Tinfoil models."""
     DEEPSEEK = "deepseek"  # DeepSeek R1 70B
@@ -74,25 +103,9 @@ class SmartModelSelector:
         }
         
         # Detect code patterns
-        code_patterns = [
-            r'def\s+\w+\s*\(',           # Python functions
-            r'function\s+\w+\s*\(',      # JavaScript functions
-            r'class\s+\w+',              # Classes
-            r'import\s+\w+',             # Imports
-            r'const\s+\w+\s*=',          # Constants
-            r'var\s+\w+\s*=',            # Variables
-            r'if\s*\(',                  # Conditionals
-            r'for\s*\(',                 # Loops
-            r'api_key\s*=',              # API keys
-            r'password\s*=',             # Passwords
-            r'database_url\s*=',         # Database URLs
-        ]
-        
-        for pattern in code_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                characteristics["has_code"] = True
-                characteristics["complexity_score"] += 2
-                break
+        if CODE_PATTERN.search(content):
+            characteristics["has_code"] = True
+            characteristics["complexity_score"] += 2
         
         # Detect multilingual content
         non_english_chars = re.findall(r'[^\x00-\x7F]', content)
@@ -101,31 +114,14 @@ class SmartModelSelector:
             characteristics["complexity_score"] += 1
         
         # Detect technical terms
-        technical_patterns = [
-            r'\b(api|sdk|endpoint|microservice|kubernetes|docker|aws|azure|gcp)\b',
-            r'\b(database|server|client|protocol|algorithm|framework)\b',
-            r'\b(encryption|authentication|authorization|ssl|tls)\b'
-        ]
-        
-        for pattern in technical_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                characteristics["has_technical_terms"] = True
-                characteristics["complexity_score"] += 1
-                break
+        if TECHNICAL_PATTERN.search(content):
+            characteristics["has_technical_terms"] = True
+            characteristics["complexity_score"] += 1
         
         # Detect financial data
-        financial_patterns = [
-            r'\$\d+',                    # Dollar amounts
-            r'\b\d+\.\d{2}\b',           # Decimal amounts
-            r'\b(contract|invoice|payment|budget|revenue|profit)\b',
-            r'\b(account|bank|credit|debit|transaction)\b'
-        ]
-        
-        for pattern in financial_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                characteristics["has_financial_data"] = True
-                characteristics["complexity_score"] += 1
-                break
+        if FINANCIAL_PATTERN.search(content):
+            characteristics["has_financial_data"] = True
+            characteristics["complexity_score"] += 1
         
         # Adjust complexity based on length
         if characteristics["length"] > 10000:
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the health checker's cached and concurrent checks.
+"""
+
+import functools
+import subprocess
+import sys
+import threading
+from datetime import timedelta
+
+import pytest
+
+health_check = pytest.importorskip("secureai.health_check")
+HealthChecker = health_check.HealthChecker
+
+
+class Clock:
+    """A monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch the health check module's monotonic clock."""
+    clock = Clock()
+    monkeypatch.setattr(health_check.time, "monotonic", clock)
+    return clock
+
+
+def _count_calls(monkeypatch, name):
+    """Count calls to a cached check method, below its cache."""
+    calls = []
+    original = getattr(HealthChecker, name).__wrapped__
+
+    @functools.wraps(original)
+    def counting(self):
+        calls.append(name)
+        return original(self)
+
+    monkeypatch.setattr(HealthChecker, name, health_check._cached_check(counting))
+    return calls
+
+
+def test_tinfoil_check_is_cached_across_health_checks(clock, monkeypatch):
+    """Test that repeated probes within the TTL make one Tinfoil call."""
+    monkeypatch.setenv("TINFOIL_API_KEY", "test-key")
+    calls = _count_calls(monkeypatch, "_check_tinfoil_api")
+    checker = HealthChecker()
+
+    first = checker.check_health()
+    second = checker.check_health()
+    checker.check_health()
+    assert len(calls) == 1
+
+    # Each report still carries its own check time
+    assert first["dependencies"]["tinfoil_api"]["last_check"] == first["timestamp"]
+    assert second["services"]["external_apis"]["tinfoil"]["last_check"] == second["timestamp"]
+
+    clock.now += health_check.CHECK_CACHE_TTL + 1
+    checker.check_health()
+    assert len(calls) == 2
+
+
+class FakeResponse:
+    status_code = 200
+    elapsed = timedelta(milliseconds=5)
+
+
+class FakeSession:
+    """Answers the local API probe without a network."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        return FakeResponse()
+
+
+@pytest.fixture
+def checker():
+    """A health checker whose local API probe is answered in process."""
+    checker = HealthChecker()
+    checker._session = FakeSession()
+    return checker
+
+
+def test_cached_check_hits_within_ttl_and_misses_after(clock, monkeypatch, checker):
+    """Test that a cached check runs once per CHECK_CACHE_TTL seconds."""
+    calls = _count_calls(monkeypatch, "_check_redis_connectivity")
+
+    first = checker._check_redis_connectivity()
+    clock.now += health_check.CHECK_CACHE_TTL - 0.5
+    assert checker._check_redis_connectivity() is first
+    assert len(calls) == 1
+
+    clock.now += 1
+    checker._check_redis_connectivity()
+    assert len(calls) == 2
+
+
+def test_timed_out_check_is_reported_unhealthy(monkeypatch, checker):
+    """Test that a check slower than CHECK_TIMEOUT is reported, not waited for."""
+    monkeypatch.setattr(health_check, "CHECK_TIMEOUT", 0.05)
+    release = threading.Event()
+
+    def slow_check():
+        release.wait(5)
+        return {"status": "healthy"}
+
+    monkeypatch.setattr(checker, "_check_cache_health", slow_check)
+    try:
+        health = checker.check_health()
+    finally:
+        release.set()
+
+    assert health["services"]["cache"]["status"] == "unhealthy"
+    assert health["services"]["cache"]["error"] == "TimeoutError"
+    assert health["services"]["api"]["status"] == "healthy"
+    assert health["status"] == "degraded"
+
+
+def test_status_helpers_reuse_cached_checks(clock, monkeypatch, checker):
+    """Test that is_healthy and get_status_summary share cached check results."""
+    monkeypatch.delenv("TINFOIL_API_KEY", raising=False)
+    calls = _count_calls(monkeypatch, "_check_database_connectivity")
+
+    checker.is_healthy()
+    summary = checker.get_status_summary()
+    checker.is_healthy()
+
+    assert len(calls) == 1
+    assert checker._session.calls == 1
+    assert set(summary) == {"status", "uptime", "version", "timestamp"}
+
+
+def test_history_keeps_the_latest_entries(checker):
+    """Test that the health history is bounded and returned oldest first."""
+    for i in range(checker.max_history_size + 50):
+        checker._store_health_status({"index": i})
+
+    assert len(checker.health_history) == checker.max_history_size
+    last = checker.max_history_size + 49
+    assert [h["index"] for h in checker.get_health_history(3)] == [last - 2, last - 1, last]
+
+
+def test_import_does_not_load_psutil():
+    """Test that psutil is only imported when system health is first checked."""
+    code = "import sys, secureai.health_check; print('psutil' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
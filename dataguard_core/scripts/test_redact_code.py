@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for reading and saving code files around redaction.
+"""
+
+import os
+
+import pytest
+
+redact_code = pytest.importorskip("secureai.redact_code")
+
+
+def _write(path, data: bytes):
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_read_rejects_binary_content(tmp_path):
+    """Test that a file with a NUL byte near the start is refused as binary."""
+    path = _write(tmp_path / "image.py", b"\x89PNG\x00\x00data")
+    with pytest.raises(Exception, match="binary content"):
+        redact_code.read_code_file(path)
+
+
+def test_read_decodes_utf8(tmp_path):
+    """Test that UTF-8 files are decoded as UTF-8."""
+    path = _write(tmp_path / "app.py", "name = 'Zoë'\n".encode("utf-8"))
+    assert redact_code.read_code_file(path) == "name = 'Zoë'\n"
+
+
+def test_read_falls_back_to_latin1(tmp_path):
+    """Test that files that are not valid UTF-8 are decoded as latin-1."""
+    path = _write(tmp_path / "app.py", b"name = 'caf\xe9'\n")
+    assert redact_code.read_code_file(path) == "name = 'café'\n"
+
+
+def test_read_normalizes_newlines(tmp_path):
+    """Test that CRLF and CR line endings are read as LF, like text mode."""
+    path = _write(tmp_path / "app.py", b"a = 1\r\nb = 2\rc = 3\n")
+    assert redact_code.read_code_file(path) == "a = 1\nb = 2\nc = 3\n"
+
+
+def test_save_writes_next_to_original(tmp_path):
+    """Test that the redacted file is saved beside the original, with no temp file left."""
+    original = str(tmp_path / "app.py")
+
+    saved = redact_code.save_redacted_code(original, "key = 'sk-****'\nname = 'Zoë'\n")
+
+    assert saved == str(tmp_path / "app_redacted.py")
+    expected = "key = 'sk-****'\nname = 'Zoë'\n".replace("\n", os.linesep)
+    with open(saved, "rb") as f:
+        assert f.read() == expected.encode("utf-8")
+    assert sorted(os.listdir(tmp_path)) == ["app_redacted.py"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_save_uses_mode_644(tmp_path):
+    """Test that the saved file is created readable by all, writable by its owner."""
+    old_umask = os.umask(0)
+    try:
+        saved = redact_code.save_redacted_code(str(tmp_path / "app.py"), "x = 1\n")
+    finally:
+        os.umask(old_umask)
+    assert os.stat(saved).st_mode & 0o777 == 0o644
+
+
+@pytest.mark.parametrize("failing", ["write", "replace"])
+def test_failed_save_leaves_no_temp_file(tmp_path, monkeypatch, failing):
+    """Test that a save failing at either step removes its temporary file."""
+    def fail(*args):
+        raise OSError(28, "No space left on device")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(redact_code.os, failing, fail)
+        with pytest.raises(Exception, match="Could not save redacted file"):
+            redact_code.save_redacted_code(str(tmp_path / "app.py"), "x = 1\n")
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_oversized_file_is_not_redacted(tmp_path, monkeypatch):
+    """Test that files over MAX_CODE_FILE_SIZE are refused before reading them."""
+    monkeypatch.setattr(redact_code, "MAX_CODE_FILE_SIZE", 16)
+    lookups = []
+    monkeypatch.setattr(
+        redact_code, "get_sensitive_data", lambda code, llm: lookups.append(code)
+    )
+
+    too_big = _write(tmp_path / "big.py", b"x = 1\n" * 3)
+    result = redact_code.redact_code_file(too_big, None)
+    assert result == {"success": False, "error": f"File too large to redact: {too_big}"}
+    assert lookups == []
+
+    # A file at the limit is read and sent on for detection
+    at_limit = _write(tmp_path / "ok.py", b"x = 1\n" * 2 + b"y=2\n")
+    redact_code.redact_code_file(at_limit, None)
+    assert lookups == ["x = 1\nx = 1\ny=2\n"]
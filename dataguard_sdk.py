@@ -6,18 +6,60 @@ A developer-friendly SDK for protecting sensitive data in AI applications.
 
 import os
 import sys
+import time
 import uuid
 import json
+import re
 import logging
+import weakref
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Enhanced patterns for comprehensive detection, compiled once at import
+_BASIC_PATTERNS = (
+    # Email addresses
+    (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'), 'email'),
+    # Phone numbers (various formats)
+    (re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'), 'phone'),
+    (re.compile(r'\b\(\d{3}\)\s?\d{3}[-.\s]?\d{4}\b'), 'phone'),
+    # Social Security Numbers
+    (re.compile(r'\b\d{3}-\d{2}-\d{4}\b'), 'ssn'),
+    # Credit card numbers
+    (re.compile(r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b'), 'credit_card'),
+    # API keys
+    (re.compile(r'sk-[a-zA-Z0-9]{32,}'), 'api_key'),
+    (re.compile(r'pk_[a-zA-Z0-9]{32,}'), 'api_key'),
+    (re.compile(r'AIza[0-9A-Za-z-_]{35}'), 'api_key'),  # Google API keys
+    # Database URLs
+    (re.compile(r'[a-zA-Z]+://[^/\s]+:[^/\s]+@[^/\s]+'), 'database_url'),
+    # IP addresses
+    (re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'), 'ip_address'),
+    # Names (enhanced pattern)
+    (re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b'), 'person'),
+    # Addresses (basic pattern)
+    (re.compile(r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr)\b'), 'address'),
+    # Dates (various formats)
+    (re.compile(r'\b\d{1,2}/\d{1,2}/\d{4}\b'), 'date'),
+    (re.compile(r'\b\d{4}-\d{2}-\d{2}\b'), 'date'),
+)
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
 class ProtectionLevel(Enum):
     """Protection levels for different use cases."""
     BASIC = "basic"
@@ -37,7 +79,7 @@ class EntityType(Enum):
     ADDRESS = "address"
     DATE = "date"
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Represents a detected entity."""
     original_value: str
@@ -47,7 +89,7 @@ class Entity:
     start_position: int
     end_position: int
 
-@dataclass
+@dataclass(slots=True)
 class ProtectionResult:
     """Result of a protection operation."""
     original_text: str
@@ -73,6 +115,10 @@ class DataGuard:
         print(result.protected_text)
     """
     
+    # Advanced shields are shared by every DataGuard with the same API key
+    # and persistence setting, and dropped once none of them is left
+    _shield_cache = weakref.WeakValueDictionary()
+    
     def __init__(self, 
                  api_key: str = None,
                  protection_level: ProtectionLevel = ProtectionLevel.STANDARD,
@@ -113,9 +159,8 @@ class DataGuard:
             # Try to import advanced components
             from secure_AI.ai_privacy_shield import SecureAIPrivacyShield
             
-            self.shield = SecureAIPrivacyShield(
-                tinfoil_api_key=self.api_key,
-                enable_persistence=self.enable_persistence
+            self.shield = self._get_or_create_shield(
+                SecureAIPrivacyShield, self.api_key, self.enable_persistence
             )
             return True
             
@@ -125,6 +170,20 @@ class DataGuard:
             logger.warning(f"Advanced detection not available: {e}")
             return False
     
+    @classmethod
+    def _get_or_create_shield(cls, shield_class, api_key: Optional[str] = None,
+                              enable_persistence: bool = True):
+        """Return the shared advanced shield for these settings, creating it if needed."""
+        key = (api_key, enable_persistence)
+        shield = cls._shield_cache.get(key)
+        if shield is None:
+            shield = shield_class(
+                tinfoil_api_key=api_key,
+                enable_persistence=enable_persistence
+            )
+            cls._shield_cache[key] = shield
+        return shield
+    
     def protect(self, 
                 text: str, 
                 session_id: str = None,
@@ -143,14 +202,14 @@ class DataGuard:
         if not session_id:
             session_id = str(uuid.uuid4())
         
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         if self.advanced_available:
             result = self._protect_advanced(text, session_id, user_id)
         else:
             result = self._protect_basic(text, session_id)
         
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         # Store session data
         self.sessions[session_id] = {
@@ -208,42 +267,12 @@ class DataGuard:
     
     def _protect_basic(self, text: str, session_id: str) -> ProtectionResult:
         """Enhanced basic detection using regex patterns."""
-        import re
-        
         entities = []
         protected_text = text
         entity_count = 0
         
-        # Enhanced patterns for comprehensive detection
-        patterns = [
-            # Email addresses
-            (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', 'email'),
-            # Phone numbers (various formats)
-            (r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b', 'phone'),
-            (r'\b\(\d{3}\)\s?\d{3}[-.\s]?\d{4}\b', 'phone'),
-            # Social Security Numbers
-            (r'\b\d{3}-\d{2}-\d{4}\b', 'ssn'),
-            # Credit card numbers
-            (r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b', 'credit_card'),
-            # API keys
-            (r'sk-[a-zA-Z0-9]{32,}', 'api_key'),
-            (r'pk_[a-zA-Z0-9]{32,}', 'api_key'),
-            (r'AIza[0-9A-Za-z-_]{35}', 'api_key'),  # Google API keys
-            # Database URLs
-            (r'[a-zA-Z]+://[^/\s]+:[^/\s]+@[^/\s]+', 'database_url'),
-            # IP addresses
-            (r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', 'ip_address'),
-            # Names (enhanced pattern)
-            (r'\b[A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b', 'person'),
-            # Addresses (basic pattern)
-            (r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr)\b', 'address'),
-            # Dates (various formats)
-            (r'\b\d{1,2}/\d{1,2}/\d{4}\b', 'date'),
-            (r'\b\d{4}-\d{2}-\d{2}\b', 'date'),
-        ]
-        
-        for pattern, entity_type in patterns:
-            for match in re.finditer(pattern, text):
+        for pattern, entity_type in _BASIC_PATTERNS:
+            for match in pattern.finditer(text):
                 original_value = match.group()
                 
                 # Check for existing mapping
@@ -335,7 +364,7 @@ class DataGuard:
         }
         
         if format.lower() == "json":
-            return json.dumps(session_data, indent=2)
+            return _dumps_indented(session_data)
         else:
             return str(session_data)
 
@@ -6,7 +6,10 @@ Comprehensive demonstration of PII protection for AI agents
 
 import os
 import sys
+import asyncio
 import time
+import itertools
+from collections import deque
 from typing import List, Dict, Any
 
 # Add the current directory to Python path for local development
@@ -27,17 +30,29 @@ except ImportError as e:
     print("Please install the SDK first: pip install secureai-privacy-shield")
     sys.exit(1)
 
+# Simulated model latency is off by default, so the timings the demos print
+# reflect redaction cost. Set DEMO_SIMULATE_LATENCY=1 to add it back.
+SIMULATE_LATENCY = bool(os.getenv("DEMO_SIMULATE_LATENCY"))
+
+# Most conversation turns an agent keeps; older turns are dropped
+HISTORY_LIMIT = 1024
+
+def _last_turns(history: deque, count: int = 3) -> List[Dict[str, Any]]:
+    """Return the last few turns, oldest first, without walking the whole history."""
+    return list(itertools.islice(reversed(history), count))[::-1]
+
 class DemoAIAgent:
     """Demo AI agent that simulates processing user input"""
     
     def __init__(self, name: str = "DemoAgent"):
         self.name = name
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=HISTORY_LIMIT)
     
     def process_message(self, message: str) -> str:
         """Simulate AI agent processing a message"""
         # Simulate some processing time
-        time.sleep(0.1)
+        if SIMULATE_LATENCY:
+            time.sleep(0.1)
         
         # Simulate AI response (this is where PII could leak)
         response = f"{self.name}: I understand you said '{message}'. Let me help you with that."
@@ -56,12 +71,12 @@ class DemoAIAgent:
         if not self.conversation_history:
             return "No conversation history"
         
-        summary = f"Conversation summary ({len(self.conversation_history)} messages):\n"
-        for i, conv in enumerate(self.conversation_history[-3:], 1):  # Last 3 messages
-            summary += f"{i}. User: {conv['user']}\n"
-            summary += f"   Agent: {conv['agent']}\n"
+        lines = [f"Conversation summary ({len(self.conversation_history)} messages):"]
+        for i, conv in enumerate(_last_turns(self.conversation_history), 1):
+            lines.append(f"{i}. User: {conv['user']}")
+            lines.append(f"   Agent: {conv['agent']}")
         
-        return summary
+        return "\n".join(lines) + "\n"
 
 class ProtectedAIAgent:
     """AI agent with built-in privacy protection"""
@@ -69,7 +84,7 @@ class ProtectedAIAgent:
     def __init__(self, shield: SecureAIShield, name: str = "ProtectedAgent"):
         self.shield = shield
         self.name = name
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=HISTORY_LIMIT)
     
     def process_message(self, message: str) -> str:
         """Process message with automatic privacy protection"""
@@ -77,7 +92,8 @@ class ProtectedAIAgent:
         protected_input = self.shield.redact(message)
         
         # Process with AI (simulated)
-        time.sleep(0.1)
+        if SIMULATE_LATENCY:
+            time.sleep(0.1)
         response = f"{self.name}: I understand you said '{protected_input.redacted_content}'. Let me help you with that."
         
         # Protect output
@@ -98,14 +114,14 @@ class ProtectedAIAgent:
         if not self.conversation_history:
             return "No conversation history"
         
-        summary = f"Protected conversation summary ({len(self.conversation_history)} messages):\n"
-        for i, conv in enumerate(self.conversation_history[-3:], 1):
-            summary += f"{i}. User: {conv['user']}\n"
-            summary += f"   Agent: {conv['agent']}\n"
+        lines = [f"Protected conversation summary ({len(self.conversation_history)} messages):"]
+        for i, conv in enumerate(_last_turns(self.conversation_history), 1):
+            lines.append(f"{i}. User: {conv['user']}")
+            lines.append(f"   Agent: {conv['agent']}")
             if conv.get('redaction_summary'):
-                summary += f"   Redactions: {len(conv['redaction_summary'])} items\n"
+                lines.append(f"   Redactions: {len(conv['redaction_summary'])} items")
         
-        return summary
+        return "\n".join(lines) + "\n"
 
 def demo_basic_protection():
     """Demonstrate basic PII protection"""
@@ -204,14 +220,16 @@ def demo_decorator_usage():
     def ai_chat(message: str) -> str:
         """AI chat function with automatic protection"""
         # Simulate AI processing
-        time.sleep(0.1)
+        if SIMULATE_LATENCY:
+            time.sleep(0.1)
         return f"AI: I understand you said '{message}'. Here's my response."
     
     @protect_ai_agent(shield)
     def ai_analyze(text: str) -> str:
         """AI analysis function with automatic protection"""
         # Simulate AI analysis
-        time.sleep(0.1)
+        if SIMULATE_LATENCY:
+            time.sleep(0.1)
         return f"Analysis: The text '{text}' contains important information."
     
     # Test the protected functions
@@ -230,6 +248,11 @@ def demo_decorator_usage():
         analysis_response = ai_analyze(message)
         print(f"Analysis: {analysis_response}")
 
+async def _redact_batch(shield: SecureAIShield, contents: List[str]):
+    """Redact a batch in one request, then close the shield's async session."""
+    async with shield:
+        return await shield.redact_batch_async(contents)
+
 def demo_batch_processing():
     """Demonstrate batch processing capabilities"""
     print("\n" + "="*60)
@@ -256,13 +279,15 @@ def demo_batch_processing():
     
     print(f"Processing batch of {len(batch_contents)} items...")
     
-    # Process batch
-    start_time = time.time()
-    results = shield.redact_batch(batch_contents)
-    total_time = time.time() - start_time
+    # Process batch; the items go to the service in one /api/redact_batch
+    # request, so the batch costs a single round trip
+    start_time = time.perf_counter()
+    results = asyncio.run(_redact_batch(shield, batch_contents))
+    total_time = time.perf_counter() - start_time
     
     print(f"Batch processing completed in {total_time:.2f} seconds")
     print(f"Average time per item: {(total_time/len(batch_contents))*1000:.2f}ms")
+    print(f"Throughput: {len(batch_contents)/total_time:.1f} items/s")
     
     # Show results
     for i, result in enumerate(results, 1):
@@ -6,18 +6,70 @@ Comprehensive Python SDK for integrating privacy protection with AI agents.
 import requests
 import json
 import time
+import hashlib
+import random
+import re
 import logging
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
-import aiohttp
 from functools import wraps
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _json_dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a request body as JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Retry backoff: full jitter over base * 2**attempt seconds, capped
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 30.0
+
+# Cheap local check for pattern-shaped PII: an email address (an @) or a run
+# of seven or more digits, however separated (phone numbers, SSNs, card
+# numbers). It cannot see names or addresses, so it is only used when the
+# caller opts in with local_prefilter.
+_PII_HINT_PATTERN = re.compile(r"@|\d(?:[-.\s()]*\d){6,}")
+
+# Most items sent in one /api/redact_batch request (the service's default cap)
+BATCH_MAX_ITEMS = 100
+
+# Least seconds between sweeps of expired cache entries
+CACHE_SWEEP_INTERVAL = 60.0
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retrying, honoring a server's Retry-After if given."""
+    if retry_after:
+        try:
+            # Clamped, so a negative or huge value cannot break or stall the retry
+            return max(0.0, min(RETRY_BACKOFF_CAP, float(retry_after)))
+        except ValueError:
+            pass
+    # Full jitter, so clients that failed together do not retry together
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+def _is_retryable(status: Optional[int]) -> bool:
+    """Whether a failed request is worth retrying; None means no response arrived."""
+    # Other client errors will fail the same way again
+    return status is None or status == 429 or status >= 500
+
 class RedactionLevel(Enum):
     """Redaction levels for different privacy requirements."""
     BASIC = "basic"      # Email, phone, SSN
@@ -73,7 +125,11 @@ class SecureAIShield:
         cache_ttl: int = 3600,
         timeout: int = 30,
         max_retries: int = 3,
-        custom_patterns: Optional[Dict[str, str]] = None
+        custom_patterns: Optional[Dict[str, str]] = None,
+        pool_size: int = 100,
+        max_cache_size: int = 10000,
+        max_concurrency: int = 20,
+        local_prefilter: bool = False
     ):
         """
         Initialize the SecureAI Shield.
@@ -87,19 +143,35 @@ class SecureAIShield:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             custom_patterns: Custom redaction patterns
+            pool_size: Maximum kept-alive connections, for sync and async requests
+            max_cache_size: Maximum cached results; least recently used go first
+            max_concurrency: Maximum requests a single async batch has in flight,
+                at least 1 (kept at or below pool_size so requests never queue
+                for a connection)
+            local_prefilter: Skip the API for content with no email or digit run.
+                Off by default, since the service may also redact names and
+                addresses the check cannot see; always off with custom_patterns.
         """
         self.api_key = api_key
         self.endpoint = endpoint.rstrip('/')
         self.redaction_level = redaction_level
         self.enable_cache = enable_cache
         self.cache_ttl = cache_ttl
+        self.max_cache_size = max_cache_size
         self.timeout = timeout
         self.max_retries = max_retries
         self.custom_patterns = custom_patterns or {}
+        self.pool_size = pool_size
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        # A pool_size of 0 leaves the async connector unlimited
+        self.max_concurrency = min(max_concurrency, pool_size) if pool_size > 0 else max_concurrency
+        # Custom patterns can match text the local check knows nothing about
+        self.local_prefilter = local_prefilter and not self.custom_patterns
         
-        # Initialize cache
-        self._cache = {}
-        self._cache_timestamps = {}
+        # LRU cache of cache key -> (result, expiry), oldest use first
+        self._cache: "OrderedDict[str, Tuple[RedactionResult, float]]" = OrderedDict()
+        self._last_sweep = time.time()
         
         # Initialize metrics
         self.metrics = ProtectionMetrics()
@@ -111,6 +183,23 @@ class SecureAIShield:
             'Content-Type': 'application/json',
             'User-Agent': 'SecureAI-SDK/1.0.0'
         })
+        # The shield talks to a single host, so one pool sized like the async
+        # connector lets threaded callers keep their connections alive rather
+        # than discarding them past requests' default of 10
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Keep-alive session for async requests, created on first use
+        self._aio_session = None
+        self._aio_session_loop = None
+        
+        # Async redactions in progress, by cache key, so concurrent requests
+        # for the same content share one API call
+        self._inflight: Dict[str, "asyncio.Future[Optional[RedactionResult]]"] = {}
+        
+        # Cleared if the service turns out not to offer /api/redact_batch
+        self._batch_endpoint_available = True
         
         logger.info(f"SecureAI Shield initialized with endpoint: {endpoint}")
     
@@ -136,12 +225,20 @@ class SecureAIShield:
         start_time = time.time()
         
         try:
+            # Content with nothing PII-like needs no API call or cache entry
+            if self.local_prefilter and not _PII_HINT_PATTERN.search(content):
+                return self._unchanged_result(content, start_time)
+            
+            # Hash the content once, for both the lookup and the store
+            cache_key = (
+                self._generate_cache_key(content, content_type)
+                if use_cache and self.enable_cache else None
+            )
+            
             # Check cache first
-            if use_cache and self.enable_cache:
-                cache_key = self._generate_cache_key(content, content_type)
+            if cache_key is not None:
                 cached_result = self._get_from_cache(cache_key)
                 if cached_result:
-                    self.metrics.cache_hits += 1
                     return cached_result
             
             # Prepare request
@@ -172,8 +269,7 @@ class SecureAIShield:
             )
             
             # Cache result
-            if use_cache and self.enable_cache:
-                cache_key = self._generate_cache_key(content, content_type)
+            if cache_key is not None:
                 self._add_to_cache(cache_key, result)
             
             # Update metrics
@@ -217,15 +313,35 @@ class SecureAIShield:
             RedactionResult with redacted content and metadata
         """
         start_time = time.time()
+        inflight = None
+        result = None
         
         try:
+            # Content with nothing PII-like needs no API call or cache entry
+            if self.local_prefilter and not _PII_HINT_PATTERN.search(content):
+                return self._unchanged_result(content, start_time)
+            
+            # Hash the content once, for both the lookup and the store
+            cache_key = (
+                self._generate_cache_key(content, content_type)
+                if use_cache and self.enable_cache else None
+            )
+            
             # Check cache first
-            if use_cache and self.enable_cache:
-                cache_key = self._generate_cache_key(content, content_type)
+            if cache_key is not None:
                 cached_result = self._get_from_cache(cache_key)
                 if cached_result:
-                    self.metrics.cache_hits += 1
                     return cached_result
+                
+                pending = self._inflight.get(cache_key)
+                if pending is not None:
+                    # Identical content is already being redacted; share its result
+                    shared = await asyncio.shield(pending)
+                    if shared is not None:
+                        return shared
+                else:
+                    inflight = asyncio.get_running_loop().create_future()
+                    self._inflight[cache_key] = inflight
             
             # Prepare request
             payload = {
@@ -240,18 +356,8 @@ class SecureAIShield:
             if self.custom_patterns:
                 payload["custom_patterns"] = self.custom_patterns
             
-            # Make async API request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.endpoint}/api/redact",
-                    json=payload,
-                    headers={
-                        'Authorization': f'Bearer {self.api_key}',
-                        'Content-Type': 'application/json'
-                    },
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    response_data = await response.json()
+            # Make async API request over the shared session
+            response_data = await self._make_request_async("/api/redact", payload)
             
             # Process response
             processing_time = (time.time() - start_time) * 1000
@@ -265,8 +371,7 @@ class SecureAIShield:
             )
             
             # Cache result
-            if use_cache and self.enable_cache:
-                cache_key = self._generate_cache_key(content, content_type)
+            if cache_key is not None:
                 self._add_to_cache(cache_key, result)
             
             # Update metrics
@@ -282,13 +387,21 @@ class SecureAIShield:
             self.metrics.failed_redactions += 1
             
             logger.error(f"Async redaction failed: {e}")
-            return RedactionResult(
+            result = RedactionResult(
                 redacted_content=content,
                 original_content=content,
                 redaction_summary={},
                 processing_time_ms=(time.time() - start_time) * 1000,
                 error=str(e)
             )
+            return result
+        
+        finally:
+            if inflight is not None:
+                # Release the waiters; None (this call was cancelled) tells
+                # them to make their own request
+                del self._inflight[cache_key]
+                inflight.set_result(result)
     
     def redact_batch(
         self,
@@ -309,11 +422,34 @@ class SecureAIShield:
         Returns:
             List of RedactionResult objects
         """
-        results = []
+        results, misses, cache_keys = self._batch_from_cache(contents, content_type, use_cache)
+        if not misses:
+            return results
         
-        for content in contents:
-            result = self.redact(content, content_type, user_id, use_cache)
-            results.append(result)
+        # Send the uncached items in as few requests as the service allows
+        while misses and self._batch_endpoint_available:
+            chunk = misses[:BATCH_MAX_ITEMS]
+            start_time = time.time()
+            try:
+                response = self._make_request(
+                    "/api/redact_batch",
+                    self._batch_payload(contents, chunk, content_type, user_id, use_cache)
+                )
+                self._batch_to_results(
+                    results, contents, chunk, cache_keys, response,
+                    (time.time() - start_time) * 1000
+                )
+            except SecureAIError as e:
+                logger.warning(f"Batch request failed, redacting items individually: {e}")
+                # Older services have no batch endpoint; stop trying it
+                status = getattr(getattr(e.__context__, "response", None), "status_code", None)
+                if status in (404, 405):
+                    self._batch_endpoint_available = False
+                break
+            misses = misses[BATCH_MAX_ITEMS:]
+        
+        for i in misses:
+            results[i] = self.redact(contents[i], content_type, user_id, use_cache)
         
         return results
     
@@ -336,29 +472,182 @@ class SecureAIShield:
         Returns:
             List of RedactionResult objects
         """
-        tasks = [
-            self.redact_async(content, content_type, user_id, use_cache)
-            for content in contents
-        ]
+        results, misses, cache_keys = self._batch_from_cache(contents, content_type, use_cache)
+        if not misses:
+            return results
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Send the uncached items in as few requests as the service allows
+        while misses and self._batch_endpoint_available:
+            chunk = misses[:BATCH_MAX_ITEMS]
+            start_time = time.time()
+            try:
+                response_data = await self._make_request_async(
+                    "/api/redact_batch",
+                    self._batch_payload(contents, chunk, content_type, user_id, use_cache)
+                )
+                self._batch_to_results(
+                    results, contents, chunk, cache_keys, response_data,
+                    (time.time() - start_time) * 1000
+                )
+            except SecureAIError as e:
+                logger.warning(f"Batch request failed, redacting items individually: {e}")
+                # Older services have no batch endpoint; stop trying it
+                if getattr(e.__context__, "status", None) in (404, 405):
+                    self._batch_endpoint_available = False
+                break
+            misses = misses[BATCH_MAX_ITEMS:]
+        
+        # Bound the fan-out, so a large batch does not open a request per
+        # item at once and run into connection or rate limits
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def redact_one(content: str) -> RedactionResult:
+            async with semaphore:
+                return await self.redact_async(content, content_type, user_id, use_cache)
+        
+        tasks = [redact_one(contents[i]) for i in misses]
+        
+        gathered = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Handle exceptions
-        processed_results = []
-        for result in results:
+        for i, result in zip(misses, gathered):
             if isinstance(result, Exception):
                 logger.error(f"Batch redaction failed: {result}")
-                processed_results.append(RedactionResult(
+                results[i] = RedactionResult(
                     redacted_content="",
                     original_content="",
                     redaction_summary={},
                     processing_time_ms=0,
                     error=str(result)
-                ))
+                )
+            else:
+                results[i] = result
+        
+        return results
+    
+    def _batch_from_cache(
+        self,
+        contents: List[str],
+        content_type: ContentType,
+        use_cache: bool
+    ) -> Tuple[List[Optional[RedactionResult]], List[int], Optional[List[str]]]:
+        """
+        Fill a batch's results from the cache.
+        
+        Returns the results, the indices still to redact, and each item's
+        cache key (None when caching is off).
+        """
+        results: List[Optional[RedactionResult]] = [None] * len(contents)
+        pending = range(len(contents))
+        if self.local_prefilter:
+            start_time = time.time()
+            pending = []
+            for i, content in enumerate(contents):
+                if _PII_HINT_PATTERN.search(content):
+                    pending.append(i)
+                else:
+                    results[i] = self._unchanged_result(content, start_time)
+        
+        if not (use_cache and self.enable_cache):
+            return results, list(pending), None
+        
+        # Keys for items answered locally are never used
+        cache_keys = [
+            self._generate_cache_key(content, content_type) if results[i] is None else ""
+            for i, content in enumerate(contents)
+        ]
+        misses = []
+        for i in pending:
+            cached_result = self._get_from_cache(cache_keys[i])
+            if cached_result:
+                results[i] = cached_result
             else:
-                processed_results.append(result)
+                misses.append(i)
+        return results, misses, cache_keys
+    
+    def _unchanged_result(self, content: str, start_time: float) -> RedactionResult:
+        """Result for content the local prefilter found nothing to redact in."""
+        processing_time = (time.time() - start_time) * 1000
+        self.metrics.total_requests += 1
+        self.metrics.successful_redactions += 1
+        self.metrics.total_processing_time_ms += processing_time
+        return RedactionResult(
+            redacted_content=content,
+            original_content=content,
+            redaction_summary={},
+            processing_time_ms=processing_time
+        )
+    
+    def _batch_payload(
+        self,
+        contents: List[str],
+        misses: List[int],
+        content_type: ContentType,
+        user_id: Optional[str],
+        use_cache: bool
+    ) -> Dict[str, Any]:
+        """Build the /api/redact_batch request for the uncached items."""
+        payload = {
+            "items": [
+                {
+                    "content": contents[i],
+                    "content_type": content_type.value,
+                    "redaction_level": self.redaction_level.value,
+                    "user_id": user_id or "anonymous",
+                    "use_cache": use_cache
+                }
+                for i in misses
+            ]
+        }
+        if self.custom_patterns:
+            payload["custom_patterns"] = self.custom_patterns
+        return payload
+    
+    def _batch_to_results(
+        self,
+        results: List[Optional[RedactionResult]],
+        contents: List[str],
+        misses: List[int],
+        cache_keys: Optional[List[str]],
+        response_data: Dict[str, Any],
+        processing_time: float
+    ):
+        """Place a batch response's items into results, in request order."""
+        items = response_data.get("results")
+        if not isinstance(items, list) or len(items) != len(misses):
+            raise SecureAIError("Malformed batch response")
+        
+        # The request's time is shared evenly across its items
+        item_time = processing_time / len(misses)
+        for i, item in zip(misses, items):
+            content = contents[i]
+            self.metrics.total_requests += 1
+            
+            if not item.get("success") or "redacted_content" not in item:
+                # Reported like a failed redact call, and never cached
+                self.metrics.failed_redactions += 1
+                results[i] = RedactionResult(
+                    redacted_content=content,
+                    original_content=content,
+                    redaction_summary={},
+                    processing_time_ms=item_time,
+                    error=item.get("error") or "Redaction failed"
+                )
+                continue
+            
+            result = RedactionResult(
+                redacted_content=item["redacted_content"],
+                original_content=content,
+                redaction_summary=item.get("redaction_summary", {}),
+                processing_time_ms=item_time,
+                cached=item.get("cached", False)
+            )
+            if cache_keys is not None:
+                self._add_to_cache(cache_keys[i], result)
+            results[i] = result
+            self.metrics.successful_redactions += 1
         
-        return processed_results
+        self.metrics.total_processing_time_ms += processing_time
     
     def contains_pii(self, content: str) -> bool:
         """
@@ -370,6 +659,9 @@ class SecureAIShield:
         Returns:
             True if PII is detected, False otherwise
         """
+        if self.local_prefilter and not _PII_HINT_PATTERN.search(content):
+            return False
+        
         try:
             payload = {
                 "content": content,
@@ -445,65 +737,163 @@ class SecureAIShield:
     def _make_request(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Make HTTP request to SecureAI API."""
         url = f"{self.endpoint}{endpoint}"
+        # Encoded once, and reused if the request is retried
+        body = _json_dumps(payload)
         
         for attempt in range(self.max_retries):
             try:
                 response = self.session.post(
                     url,
-                    json=payload,
+                    data=body,
                     timeout=self.timeout
                 )
                 response.raise_for_status()
-                return response.json()
+                return _json_loads(response.content)
                 
             except requests.exceptions.RequestException as e:
-                if attempt == self.max_retries - 1:
+                response = e.response
+                status = response.status_code if response is not None else None
+                if not _is_retryable(status) or attempt == self.max_retries - 1:
                     raise SecureAIError(f"API request failed: {e}")
                 
                 logger.warning(f"Request failed, retrying ({attempt + 1}/{self.max_retries}): {e}")
-                time.sleep(2 ** attempt)  # Exponential backoff
+                retry_after = response.headers.get("Retry-After") if status == 429 else None
+                time.sleep(_retry_delay(attempt, retry_after))
+                
+            except ValueError as e:
+                raise SecureAIError(f"Invalid API response: {e}")
+    
+    async def _make_request_async(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Make HTTP request to SecureAI API over the shared async session."""
+        import aiohttp
+        
+        url = f"{self.endpoint}{endpoint}"
+        session = await self._get_aio_session()
+        # Encoded once, and reused if the request is retried
+        body = _json_dumps(payload)
+        
+        for attempt in range(self.max_retries):
+            try:
+                async with session.post(url, data=body) as response:
+                    response.raise_for_status()
+                    return _json_loads(await response.read())
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status = getattr(e, "status", None)
+                if not _is_retryable(status) or attempt == self.max_retries - 1:
+                    raise SecureAIError(f"API request failed: {e}")
+                
+                logger.warning(f"Request failed, retrying ({attempt + 1}/{self.max_retries}): {e}")
+                headers = getattr(e, "headers", None)
+                retry_after = headers.get("Retry-After") if status == 429 and headers else None
+                await asyncio.sleep(_retry_delay(attempt, retry_after))
+                
+            except ValueError as e:
+                raise SecureAIError(f"Invalid API response: {e}")
+    
+    async def _get_aio_session(self):
+        """Return the shared aiohttp session, creating it on first use."""
+        # A session is bound to the event loop it was created on, so a new
+        # one is needed if the caller has since moved to another loop
+        loop = asyncio.get_running_loop()
+        if self._aio_session is not None and self._aio_session_loop is not loop:
+            await self._close_stale_session()
+        if self._aio_session is None or self._aio_session.closed:
+            # aiohttp is only needed for async requests, so it is imported
+            # on first use rather than when the SDK is loaded
+            import aiohttp
+            
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_size,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                headers={
+                    'Authorization': f'Bearer {self.api_key}',
+                    'Content-Type': 'application/json'
+                },
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._aio_session_loop = loop
+        return self._aio_session
+    
+    async def _close_stale_session(self):
+        """Close a session left behind on another event loop."""
+        session, session_loop = self._aio_session, self._aio_session_loop
+        self._aio_session = None
+        self._aio_session_loop = None
+        if session.closed:
+            return
+        
+        if session_loop.is_running():
+            # Still running in another thread, so close it there
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            return
+        
+        # Its loop has stopped, usually because asyncio.run() returned. On a
+        # closed loop this only marks the connector closed, and its sockets
+        # are released when it is collected
+        try:
+            await session.close()
+        except Exception as e:
+            logger.debug(f"Could not close stale async session: {e}")
+    
+    async def aclose(self):
+        """Close the async session, if one was opened."""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+            self._aio_session_loop = None
     
     def _generate_cache_key(self, content: str, content_type: ContentType) -> str:
         """Generate cache key for content."""
-        import hashlib
-        key_data = f"{content}:{content_type.value}:{self.redaction_level.value}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        # BLAKE2b is faster than MD5 and the parts are fed in one at a time,
+        # so long content is never copied into a combined key string
+        key_hash = hashlib.blake2b(content.encode(), digest_size=16)
+        key_hash.update(f":{content_type.value}:{self.redaction_level.value}".encode())
+        return key_hash.hexdigest()
     
     def _get_from_cache(self, cache_key: str) -> Optional[RedactionResult]:
         """Get result from cache if valid."""
-        if cache_key in self._cache:
-            timestamp = self._cache_timestamps.get(cache_key, 0)
-            if time.time() - timestamp < self.cache_ttl:
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            if entry[1] > time.time():
+                self._cache.move_to_end(cache_key)
                 self.metrics.cache_hits += 1
-                return self._cache[cache_key]
-            else:
-                # Remove expired cache entry
-                del self._cache[cache_key]
-                del self._cache_timestamps[cache_key]
+                return entry[0]
+            # Remove expired cache entry
+            del self._cache[cache_key]
         
         self.metrics.cache_misses += 1
         return None
     
     def _add_to_cache(self, cache_key: str, result: RedactionResult):
         """Add result to cache."""
-        self._cache[cache_key] = result
-        self._cache_timestamps[cache_key] = time.time()
-        
-        # Clean up old cache entries
-        current_time = time.time()
-        expired_keys = [
-            key for key, timestamp in self._cache_timestamps.items()
-            if current_time - timestamp > self.cache_ttl
-        ]
+        now = time.time()
+        self._cache[cache_key] = (result, now + self.cache_ttl)
+        self._cache.move_to_end(cache_key)
+        
+        # Evict the least recently used entries once over capacity; expired
+        # entries are dropped when they are next looked up, or by the next sweep
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
         
+        self._maybe_sweep(now)
+    
+    def _maybe_sweep(self, now: float):
+        """Drop expired cache entries, at most once every CACHE_SWEEP_INTERVAL seconds."""
+        if now - self._last_sweep < CACHE_SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        
+        expired_keys = [key for key, (_, expiry) in self._cache.items() if expiry <= now]
         for key in expired_keys:
             del self._cache[key]
-            del self._cache_timestamps[key]
     
     def clear_cache(self):
         """Clear the cache."""
         self._cache.clear()
-        self._cache_timestamps.clear()
         logger.info("Cache cleared")
     
     def __enter__(self):
@@ -513,6 +903,15 @@ class SecureAIShield:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.session.close()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+        self.session.close()
 
 
 # Decorator for automatic protection
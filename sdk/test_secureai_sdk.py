@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Tests for the SecureAI SDK client: caching, retries and batching.
+
+The HTTP transport is replaced per test, so no SecureAI service is needed.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+import secureai_sdk
+from secureai_sdk import ContentType, RedactionLevel, SecureAIShield, SecureAIError
+
+
+def _response(status, data=None, headers=None):
+    """Build a requests Response with a JSON body."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(data or {}).encode()
+    response.headers.update(headers or {})
+    response.url = "http://secureai.test"
+    return response
+
+
+def _upper_item(content):
+    """What the fake service returns for one redacted item."""
+    return {"success": True, "redacted_content": content.upper(), "redaction_summary": {}}
+
+
+class FakeService:
+    """Stands in for session.post, answering from a list of canned statuses."""
+
+    def __init__(self, statuses=(), batch_status=200, failing=()):
+        self.statuses = list(statuses)
+        self.batch_status = batch_status
+        self.failing = set(failing)
+        self.calls = []
+
+    def post(self, url, data=None, timeout=None):
+        payload = json.loads(data)
+        endpoint = url.rsplit("/api", 1)[1]
+        self.calls.append((endpoint, payload))
+        if self.statuses:
+            status = self.statuses.pop(0)
+            if status != 200:
+                return _response(status, headers={"Retry-After": "0"})
+        if endpoint == "/redact_batch":
+            if self.batch_status != 200:
+                return _response(self.batch_status)
+            return _response(200, {"results": [
+                {"success": False, "redacted_content": "", "error": "overloaded"}
+                if item["content"] in self.failing else _upper_item(item["content"])
+                for item in payload["items"]
+            ]})
+        return _response(200, _upper_item(payload["content"]))
+
+    def endpoints(self):
+        return [endpoint for endpoint, _ in self.calls]
+
+
+@pytest.fixture
+def service():
+    """A fake service that answers every request successfully."""
+    return FakeService()
+
+
+@pytest.fixture
+def shield(service, monkeypatch):
+    """A shield whose requests go to the fake service, without retry delays."""
+    monkeypatch.setattr(secureai_sdk, "_retry_delay", lambda attempt, retry_after=None: 0)
+    shield = SecureAIShield(api_key="test-key", endpoint="http://secureai.test")
+    monkeypatch.setattr(shield.session, "post", service.post)
+    return shield
+
+
+def test_async_batch_concurrency_is_bounded(shield, monkeypatch):
+    """Test that an async batch never has more than max_concurrency requests in flight."""
+    shield.max_concurrency = 2
+    shield._batch_endpoint_available = False
+    in_flight = [0]
+    peak = [0]
+
+    async def fake_request(endpoint, payload):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return _upper_item(payload["content"])
+
+    monkeypatch.setattr(shield, "_make_request_async", fake_request)
+
+    contents = [f"user{i}@example.com" for i in range(6)]
+    results = asyncio.run(shield.redact_batch_async(contents))
+    assert [r.redacted_content for r in results] == [c.upper() for c in contents]
+    assert peak[0] == 2
+
+
+def test_max_concurrency_is_capped_at_pool_size():
+    """Test that async batches never have more requests in flight than connections."""
+    shield = SecureAIShield(api_key="test-key", pool_size=4, max_concurrency=20)
+    assert shield.max_concurrency == 4
+
+    # An unlimited pool does not limit concurrency
+    shield = SecureAIShield(api_key="test-key", pool_size=0, max_concurrency=20)
+    assert shield.max_concurrency == 20
+
+
+def test_max_concurrency_must_be_positive():
+    """Test that a concurrency limit that would stall every batch is rejected."""
+    with pytest.raises(ValueError):
+        SecureAIShield(api_key="test-key", max_concurrency=0)
+
+
+def test_async_session_is_reused_on_one_loop(shield):
+    """Test that async requests on one event loop share a session."""
+    pytest.importorskip("aiohttp")
+
+    async def sessions():
+        return await shield._get_aio_session(), await shield._get_aio_session()
+
+    first, second = asyncio.run(sessions())
+    assert first is second
+    asyncio.run(shield.aclose())
+
+
+def test_async_session_from_finished_loop_is_closed(shield):
+    """Test that moving to a new event loop closes the old loop's session."""
+    pytest.importorskip("aiohttp")
+
+    first = asyncio.run(shield._get_aio_session())
+    second = asyncio.run(shield._get_aio_session())
+    assert second is not first
+    assert first.closed
+    asyncio.run(shield.aclose())
+    assert second.closed
+
+
+def test_batch_is_sent_in_chunks(shield, service, monkeypatch):
+    """Test that uncached batch items go out in as few requests as allowed."""
+    monkeypatch.setattr(secureai_sdk, "BATCH_MAX_ITEMS", 2)
+    shield.redact("cached@example.com")
+
+    contents = ["a@example.com", "cached@example.com", "b@example.com", "c@example.com"]
+    results = shield.redact_batch(contents)
+
+    assert [r.redacted_content for r in results] == [c.upper() for c in contents]
+    assert service.endpoints() == ["/redact", "/redact_batch", "/redact_batch"]
+    sent = [item["content"] for _, payload in service.calls[1:] for item in payload["items"]]
+    assert sent == ["a@example.com", "b@example.com", "c@example.com"]
+
+
+def test_batch_failed_items_are_reported_and_not_cached(shield, service):
+    """Test that an item the service failed on comes back unredacted with an error."""
+    service.failing = {"b@example.com"}
+
+    results = shield.redact_batch(["a@example.com", "b@example.com"])
+    assert results[0].error is None
+    assert results[1].error == "overloaded"
+    assert results[1].redacted_content == "b@example.com"
+    assert shield.metrics.failed_redactions == 1
+
+    # Only the failed item is asked for again
+    service.failing = set()
+    results = shield.redact_batch(["a@example.com", "b@example.com"])
+    assert results[1].redacted_content == "B@EXAMPLE.COM"
+    assert [item["content"] for item in service.calls[-1][1]["items"]] == ["b@example.com"]
+
+
+def test_batch_falls_back_without_batch_endpoint(shield, service):
+    """Test that a service without /api/redact_batch gets one request per item."""
+    service.batch_status = 404
+
+    results = shield.redact_batch(["a@example.com", "b@example.com"])
+    assert [r.redacted_content for r in results] == ["A@EXAMPLE.COM", "B@EXAMPLE.COM"]
+    assert service.endpoints() == ["/redact_batch", "/redact", "/redact"]
+    assert not shield._batch_endpoint_available
+
+    # The endpoint is not tried again
+    shield.redact_batch(["c@example.com"])
+    assert service.endpoints()[-1] == "/redact"
+
+
+def test_async_batch_falls_back_on_error(shield, monkeypatch):
+    """Test that the async batch redacts items individually if the batch call fails."""
+    async def fake_request(endpoint, payload):
+        if endpoint == "/api/redact_batch":
+            raise SecureAIError("API request failed: 500")
+        return _upper_item(payload["content"])
+
+    monkeypatch.setattr(shield, "_make_request_async", fake_request)
+
+    results = asyncio.run(shield.redact_batch_async(["a@example.com", "b@example.com"]))
+    assert [r.redacted_content for r in results] == ["A@EXAMPLE.COM", "B@EXAMPLE.COM"]
+    # A server error is not a missing endpoint, so the batch call is kept
+    assert shield._batch_endpoint_available
+
+
+def test_cache_evicts_least_recently_used(shield, service):
+    """Test that a full cache drops the entry used longest ago."""
+    shield.max_cache_size = 2
+
+    shield.redact("a@example.com")
+    shield.redact("b@example.com")
+    shield.redact("a@example.com")  # hit, so b is now the oldest
+    shield.redact("c@example.com")  # evicts b
+    assert len(service.calls) == 3
+
+    shield.redact("a@example.com")
+    assert len(service.calls) == 3
+    shield.redact("b@example.com")
+    assert len(service.calls) == 4
+
+
+def test_cache_entries_expire(shield, service, monkeypatch):
+    """Test that a cached result is not returned past its TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(secureai_sdk.time, "time", lambda: now[0])
+
+    first = shield.redact("a@example.com")
+    assert shield.redact("a@example.com") is first
+
+    now[0] += shield.cache_ttl + 1
+    assert shield.redact("a@example.com") is not first
+    assert len(service.calls) == 2
+
+
+def test_cache_key_covers_content_type_and_level():
+    """Test that cache keys are stable BLAKE2b digests of content, type and level."""
+    shield = SecureAIShield(api_key="test-key")
+    key = shield._generate_cache_key("a@example.com", ContentType.TEXT)
+
+    assert len(key) == 32
+    assert int(key, 16) >= 0
+    assert shield._generate_cache_key("a@example.com", ContentType.TEXT) == key
+    assert shield._generate_cache_key("b@example.com", ContentType.TEXT) != key
+    assert shield._generate_cache_key("a@example.com", ContentType.CODE) != key
+
+    strict = SecureAIShield(api_key="test-key", redaction_level=RedactionLevel.STRICT)
+    assert strict._generate_cache_key("a@example.com", ContentType.TEXT) != key
+
+
+def test_retries_server_errors(shield, service):
+    """Test that 5xx and 429 responses are retried."""
+    service.statuses = [503, 429]
+
+    result = shield.redact("a@example.com")
+    assert result.error is None
+    assert result.redacted_content == "A@EXAMPLE.COM"
+    assert len(service.calls) == 3
+
+
+def test_does_not_retry_client_errors(shield, service):
+    """Test that other 4xx responses fail without a retry."""
+    service.statuses = [400]
+
+    result = shield.redact("a@example.com")
+    assert result.error is not None
+    assert result.redacted_content == "a@example.com"
+    assert len(service.calls) == 1
+
+
+def test_retry_after_is_clamped():
+    """Test that Retry-After stays within the backoff range."""
+    assert secureai_sdk._retry_delay(0, "-5") == 0.0
+    assert secureai_sdk._retry_delay(0, "2") == 2.0
+    assert secureai_sdk._retry_delay(0, "9999") == secureai_sdk.RETRY_BACKOFF_CAP
+
+
+def test_retry_delay_uses_full_jitter():
+    """Test that backoff delays are spread over the whole capped window."""
+    for attempt in range(8):
+        ceiling = min(secureai_sdk.RETRY_BACKOFF_CAP, secureai_sdk.RETRY_BACKOFF_BASE * 2 ** attempt)
+        delays = [secureai_sdk._retry_delay(attempt) for _ in range(50)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_redact_hashes_content_once(shield, monkeypatch):
+    """Test that a redaction computes its cache key once, for lookup and store."""
+    keys = []
+    generate = shield._generate_cache_key
+
+    def counting(content, content_type):
+        keys.append(content)
+        return generate(content, content_type)
+
+    monkeypatch.setattr(shield, "_generate_cache_key", counting)
+
+    shield.redact("a@example.com")  # miss, then store
+    shield.redact("a@example.com")  # hit
+    assert keys == ["a@example.com", "a@example.com"]
+
+
+def test_concurrent_redact_async_shares_one_request(shield, monkeypatch):
+    """Test that concurrent redactions of the same content make one API call."""
+    calls = []
+
+    async def fake_request(endpoint, payload):
+        calls.append(payload["content"])
+        await asyncio.sleep(0.01)
+        return _upper_item(payload["content"])
+
+    monkeypatch.setattr(shield, "_make_request_async", fake_request)
+
+    async def run():
+        return await asyncio.gather(
+            *(shield.redact_async("a@example.com") for _ in range(5)),
+            shield.redact_async("b@example.com")
+        )
+
+    results = asyncio.run(run())
+    assert sorted(calls) == ["a@example.com", "b@example.com"]
+    assert all(result is results[0] for result in results[:5])
+    assert results[5].redacted_content == "B@EXAMPLE.COM"
+
+
+def test_expired_entries_are_swept(shield, monkeypatch):
+    """Test that expired entries are dropped by a periodic sweep, not per store."""
+    now = [1000.0]
+    monkeypatch.setattr(secureai_sdk.time, "time", lambda: now[0])
+    shield._last_sweep = now[0]
+    shield.cache_ttl = 10
+
+    shield.redact("a@example.com")
+    now[0] += 20
+    shield.redact("b@example.com")
+    # Expired, but the sweep interval has not passed yet
+    assert len(shield._cache) == 2
+
+    now[0] += secureai_sdk.CACHE_SWEEP_INTERVAL
+    shield.redact("c@example.com")
+    assert len(shield._cache) == 1
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_round_trip(monkeypatch, use_orjson):
+    """Test that request bodies encode to bytes and decode back, with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(secureai_sdk, "orjson", None)
+
+    payload = {"content": "Zoë <zoe@example.com>", "use_cache": True, "items": [1, 2]}
+    body = secureai_sdk._json_dumps(payload)
+    assert isinstance(body, bytes)
+    assert secureai_sdk._json_loads(body) == payload
+
+
+def test_request_body_is_encoded_once_across_retries(shield, service, monkeypatch):
+    """Test that a retried request resends the same encoded body."""
+    bodies = []
+    post = service.post
+
+    def recording(url, data=None, timeout=None):
+        bodies.append(data)
+        return post(url, data=data, timeout=timeout)
+
+    monkeypatch.setattr(shield.session, "post", recording)
+    service.statuses = [503]
+
+    shield.redact("a@example.com")
+    assert len(bodies) == 2
+    assert isinstance(bodies[0], bytes)
+    assert bodies[1] is bodies[0]
+
+
+def test_local_prefilter_is_off_by_default(shield, service):
+    """Test that content without PII-like text still goes to the service by default."""
+    shield.redact("Hello there")
+    assert len(service.calls) == 1
+
+
+def test_local_prefilter_skips_pii_free_content(service, monkeypatch):
+    """Test that the opt-in prefilter answers PII-free content locally."""
+    shield = SecureAIShield(api_key="test-key", endpoint="http://secureai.test", local_prefilter=True)
+    monkeypatch.setattr(shield.session, "post", service.post)
+
+    assert shield.redact("Hello there").redacted_content == "Hello there"
+    assert len(service.calls) == 0
+
+    results = shield.redact_batch(["Hello there", "Call 555-123-4567", "a@example.com"])
+    assert results[0].redacted_content == "Hello there"
+    assert [item["content"] for item in service.calls[0][1]["items"]] == [
+        "Call 555-123-4567", "a@example.com"
+    ]
+
+
+def test_local_prefilter_is_disabled_by_custom_patterns():
+    """Test that custom patterns, which the prefilter cannot see, turn it off."""
+    shield = SecureAIShield(
+        api_key="test-key",
+        local_prefilter=True,
+        custom_patterns={"project": r"PROJ-\d{4}"}
+    )
+    assert not shield.local_prefilter
+
+
+def test_sync_connection_pool_matches_pool_size():
+    """Test that the requests session keeps up to pool_size connections alive."""
+    shield = SecureAIShield(api_key="test-key", pool_size=32)
+    for url in ("http://secureai.test", "https://secureai.test"):
+        adapter = shield.session.get_adapter(url)
+        assert adapter._pool_maxsize == 32
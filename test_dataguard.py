@@ -3,16 +3,29 @@
 Simple test for DataGuard components
 """
 
+import asyncio
+
 from dataguard_agent_shield import DataGuardAgentShield, AgentType, ProtectionLevel
 
+# Built once and shared by the tests below that only need a standard
+# customer service shield
+CS_SHIELD = DataGuardAgentShield(
+    agent_type=AgentType.CUSTOMER_SERVICE,
+    protection_level=ProtectionLevel.STANDARD
+)
+
+# Inputs for the batch test, built once at import
+BATCH_CASES = (
+    "My email is john.doe@company.com",
+    "My phone is 555-123-4567",
+    "No sensitive data here"
+)
+
 def test_dataguard_agent_shield():
     """Test the DataGuard Agent Shield functionality."""
     print("Testing DataGuard Agent Shield...")
     
-    @DataGuardAgentShield(
-        agent_type=AgentType.CUSTOMER_SERVICE,
-        protection_level=ProtectionLevel.STANDARD
-    ).protect_agent
+    @CS_SHIELD.protect_agent
     def test_agent(text):
         return f"Processed: {text}"
     
@@ -30,7 +43,138 @@ def test_dataguard_agent_shield():
         print("✗ DataGuard protection failed")
         return False
 
+def test_dataguard_async_agent_shield():
+    """Test that coroutine agents are protected and can run concurrently."""
+    print("Testing DataGuard Agent Shield with async agents...")
+    
+    @CS_SHIELD.protect_agent
+    async def test_agent(text):
+        await asyncio.sleep(0)
+        return f"Processed: {text}"
+    
+    async def run_batch():
+        return await asyncio.gather(
+            test_agent("My email is john.doe@company.com"),
+            test_agent("My phone is 555-123-4567")
+        )
+    
+    results = asyncio.run(run_batch())
+    print(f"Protected: {results}")
+    
+    assert "john.doe@company.com" not in results[0]
+    assert "555-123-4567" not in results[1]
+
+def test_dataguard_batch_agent_shield():
+    """Test that a batch of inputs is protected under one session."""
+    print("Testing DataGuard Agent Shield with a batch of inputs...")
+    
+    shield = DataGuardAgentShield(
+        agent_type=AgentType.CUSTOMER_SERVICE,
+        protection_level=ProtectionLevel.STANDARD
+    )
+    
+    @shield.protect_batch
+    def test_agent(text):
+        return f"Processed: {text}"
+    
+    results = test_agent(BATCH_CASES)
+    print(f"Protected: {results}")
+    
+    assert len(results) == 3
+    assert "john.doe@company.com" not in results[0]
+    assert "555-123-4567" not in results[1]
+    assert results[2] == "Processed: No sensitive data here"
+    assert len(shield.agent_sessions) == 1
+
+def test_dataguard_async_batch_agent_shield():
+    """Test that an async batch is protected with bounded concurrency."""
+    print("Testing DataGuard Agent Shield with an async batch...")
+    
+    shield = DataGuardAgentShield(
+        agent_type=AgentType.CUSTOMER_SERVICE,
+        protection_level=ProtectionLevel.STANDARD
+    )
+    in_flight = [0]
+    peak = [0]
+    
+    @shield.protect_batch(max_concurrency=2)
+    async def test_agent(text):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return f"Processed: {text}"
+    
+    results = asyncio.run(test_agent(BATCH_CASES * 2))
+    print(f"Protected: {results}")
+    
+    assert len(results) == 6
+    assert "john.doe@company.com" not in results[0]
+    assert "555-123-4567" not in results[4]
+    assert results[5] == "Processed: No sensitive data here"
+    assert peak[0] == 2
+    assert len(shield.agent_sessions) == 1
+
+def test_dataguard_nested_payload():
+    """Test that nested payloads are protected leaf by leaf in one pass."""
+    print("Testing DataGuard Agent Shield with a nested payload...")
+    
+    payload = {
+        "customer": {"email": "Contact john.doe@company.com today", "tags": ["vip"]},
+        "history": [
+            ("call", "Called from 555-123-4567"),
+            ["note", {"text": "Follow up at 555-987-6543 or jane@example.org"}],
+        ],
+        "count": 2,
+    }
+    
+    protected = CS_SHIELD._protect_input(payload, None)
+    print(f"Protected: {protected}")
+    
+    # Each leaf must match protecting it on its own, so entity offsets from
+    # the joined scan were mapped back to the right leaf
+    expected = {
+        "customer": {
+            "email": CS_SHIELD._protect_text("Contact john.doe@company.com today", None),
+            "tags": ["vip"],
+        },
+        "history": [
+            ("call", CS_SHIELD._protect_text("Called from 555-123-4567", None)),
+            ["note", {"text": CS_SHIELD._protect_text(
+                "Follow up at 555-987-6543 or jane@example.org", None)}],
+        ],
+        "count": 2,
+    }
+    assert protected == expected
+    assert isinstance(protected["history"][0], tuple)
+    assert protected["customer"]["email"] == "Contact j******e@company.com today"
+    assert protected["history"][1][1]["text"] == "Follow up at ***-***-6543 or j**e@example.org"
+    # The caller's payload is copied, not modified
+    assert payload["history"][0][1] == "Called from 555-123-4567"
+
+def test_dataguard_circular_payload():
+    """Test that self-referencing payloads are rejected instead of walked forever."""
+    print("Testing DataGuard Agent Shield with a circular payload...")
+    
+    looped = ["john.doe@company.com"]
+    looped.append(looped)
+    nested = {"items": [{"email": "john.doe@company.com"}]}
+    nested["items"][0]["parent"] = nested
+    
+    for payload in (looped, nested):
+        try:
+            CS_SHIELD._protect_input(payload, None)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("circular payload was not rejected")
+    
+    # The same list appearing twice is shared, not circular
+    shared = ["555-123-4567"]
+    assert CS_SHIELD._protect_input([shared, shared], None) == [["***-***-4567"]] * 2
+
 if __name__ == "__main__":
     print("DataGuard Test")
     print("=" * 30)
-    test_dataguard_agent_shield() 
\ No newline at end of file
+    test_dataguard_agent_shield()
+    test_dataguard_async_agent_shield() 
\ No newline at end of file